@@ -4,18 +4,86 @@ FastAPI Application - Hosted Mode API Server
 Provides HTTP endpoints for workflow invocation and session management.
 """
 
-from fastapi import FastAPI, Depends
-from fastapi.responses import JSONResponse
+from contextlib import asynccontextmanager, AsyncExitStack
+from fastapi import FastAPI, Depends, Request
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from api.routes import workflows, sessions
-from api.middleware.auth import verify_api_key
+from api.middleware.auth import verify_api_key, RateLimiter
+from lgp.checkpointing import create_checkpointer
+from pathlib import Path
+import orjson
 import os
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open shared resources once for the lifetime of the server
+
+    The session checkpointer and workflow executor are created here instead
+    of per request so handlers borrow already-initialized instances.
+    """
+    from runtime.executor import WorkflowExecutor
+    from lgp.claude_code.session_manager import get_default_manager
+
+    # Worker processes spawned by uvicorn import a fresh app; the served
+    # workflow is passed to them through the environment.
+    if not hasattr(app.state, "workflow_path") and os.getenv("LGP_WORKFLOW_PATH"):
+        app.state.workflow_path = os.environ["LGP_WORKFLOW_PATH"]
+        app.state.workflow_name = Path(app.state.workflow_path).stem
+
+    # Root response serialized once, now that the environment is loaded
+    app.state.root_body = orjson.dumps({
+        "service": "LangGraph Platform API",
+        "version": "0.1.0",
+        "environment": "hosted",
+        "status": "running",
+        "auth_enabled": os.getenv("LGP_AUTH_ENABLED", "true") == "true"
+    })
+
+    app.state.executor = WorkflowExecutor(environment="hosted", reuse_checkpointer=True)
+
+    async with AsyncExitStack() as stack:
+        # Closes the executor's shared workflow checkpointer on shutdown
+        stack.push_async_callback(app.state.executor.aclose)
+
+        # Ends the process-wide MCP session (docker exec) used by Claude
+        # Code nodes cleanly, rather than leaving it to loop teardown
+        stack.push_async_callback(get_default_manager().aclose)
+
+        checkpointer = await stack.enter_async_context(
+            create_checkpointer({
+                "path": os.getenv("LGP_CHECKPOINT_DB", "./checkpoints.db")
+            })
+        )
+
+        # The connection arrives tuned (WAL + SQLITE_CONNECTION_PRAGMAS).
+        # Create tables up front so handlers can query them directly
+        # (count_checkpoints runs alongside aget_tuple, which would
+        # otherwise be the first to create them)
+        await checkpointer.setup()
+
+        app.state.checkpointer = checkpointer
+        yield
+
+
 # Create FastAPI app
 app = FastAPI(
     title="LangGraph Platform API",
     description="Workflow runtime API for hosted mode",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
+
+
+# Paths served without auth or rate limiting (load balancer probes)
+PUBLIC_PATHS = ("/health",)
+
+# Rate limiting runs as ASGI middleware, ahead of routing (0 disables)
+app.add_middleware(
+    RateLimiter,
+    requests_per_minute=int(os.getenv("LGP_RATE_LIMIT_PER_MINUTE", "100")),
+    exempt_paths=PUBLIC_PATHS
 )
 
 
@@ -24,25 +92,25 @@ app.include_router(workflows.router)
 app.include_router(sessions.router)
 
 
+# Static health body, serialized once at import (it doesn't depend on the
+# environment, and health checks are polled at high frequency). The root
+# body is built in lifespan().
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "environment": "hosted"
+})
+
+
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Root endpoint"""
-    return {
-        "service": "LangGraph Platform API",
-        "version": "0.1.0",
-        "environment": "hosted",
-        "status": "running",
-        "auth_enabled": os.getenv("LGP_AUTH_ENABLED", "true") == "true"
-    }
+    return Response(content=request.app.state.root_body, media_type="application/json")
 
 
 @app.get("/health")
 async def health():
     """Health check endpoint (no auth required)"""
-    return {
-        "status": "healthy",
-        "environment": "hosted"
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/protected-example")
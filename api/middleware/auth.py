@@ -3,8 +3,13 @@ Authentication Middleware - API key verification for hosted mode
 """
 
 from fastapi import Security, HTTPException, status
+from fastapi.responses import JSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from functools import lru_cache
+from typing import Dict, Iterable
+import hmac
 import os
+import time
 
 
 # HTTP Bearer token scheme
@@ -20,6 +25,16 @@ def get_api_key_from_env() -> str:
     return api_key
 
 
+@lru_cache(maxsize=1)
+def _expected_key() -> bytes:
+    """API key to compare against, resolved on the first request and cached
+
+    Not read at import: the app module is imported before the CLI loads
+    .env, so LGP_API_KEY may not be in the environment yet.
+    """
+    return get_api_key_from_env().encode()
+
+
 async def verify_api_key(
     credentials: HTTPAuthorizationCredentials = Security(security)
 ) -> str:
@@ -34,9 +49,8 @@ async def verify_api_key(
     Raises:
         HTTPException: If API key is invalid
     """
-    expected_key = get_api_key_from_env()
-
-    if credentials.credentials != expected_key:
+    # Constant-time comparison against the cached key
+    if not hmac.compare_digest(credentials.credentials.encode(), _expected_key()):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key",
@@ -46,15 +60,69 @@ async def verify_api_key(
     return credentials.credentials
 
 
-# Optional: Rate limiting class (placeholder for R7)
+# Rate limiting middleware (R7)
 class RateLimiter:
-    """Rate limiter for API requests"""
+    """Fixed-window rate limiter for API requests
 
-    def __init__(self, requests_per_minute: int = 100):
-        self.requests_per_minute = requests_per_minute
-        # TODO: Implement actual rate limiting logic
+    Pure ASGI middleware: runs before routing and dependency resolution and
+    never blocks the event loop. Counts are kept in process memory, so each
+    server worker enforces its own budget.
+
+    Usage:
+        app.add_middleware(RateLimiter, requests_per_minute=100)
+    """
 
-    async def check_rate_limit(self, client_id: str):
-        """Check if client has exceeded rate limit"""
-        # TODO: Implement rate limiting
-        pass
+    def __init__(
+        self,
+        app,
+        requests_per_minute: int = 100,
+        exempt_paths: Iterable[str] = ("/health",)
+    ):
+        self.app = app
+        self.requests_per_minute = requests_per_minute
+        self.exempt_paths = frozenset(exempt_paths)
+        self._window = 0
+        self._counts: Dict[str, int] = {}
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or self.requests_per_minute <= 0
+            or scope["path"] in self.exempt_paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        client_id = client[0] if client else "unknown"
+
+        if not await self.check_rate_limit(client_id):
+            retry_after = 60 - int(time.monotonic() % 60)
+            response = JSONResponse(
+                {"detail": "Rate limit exceeded"},
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                headers={"Retry-After": str(retry_after)}
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+    async def check_rate_limit(self, client_id: str) -> bool:
+        """Record a request and check if client is within its rate limit
+
+        Args:
+            client_id: Client identifier (remote address)
+
+        Returns:
+            True if the request is allowed, False if the limit is exceeded
+        """
+        window = int(time.monotonic() // 60)
+        if window != self._window:
+            # New minute: reset all counters
+            self._window = window
+            self._counts.clear()
+
+        count = self._counts.get(client_id, 0) + 1
+        self._counts[client_id] = count
+        return count <= self.requests_per_minute
@@ -0,0 +1,25 @@
+"""
+Response Classes - Fast JSON rendering for API routes
+"""
+
+from typing import Any
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+import orjson
+
+
+class SafeORJSONResponse(ORJSONResponse):
+    """orjson response usable for content FastAPI has not pre-encoded
+
+    Returning a response directly skips FastAPI's jsonable_encoder pass.
+    Workflow state can still hold objects orjson cannot serialize natively
+    (e.g. LangChain messages), so those fall back to jsonable_encoder one
+    value at a time instead of re-walking the whole payload.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=jsonable_encoder,
+            option=orjson.OPT_NON_STR_KEYS
+        )
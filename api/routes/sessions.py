@@ -2,11 +2,11 @@
 Session Routes - HTTP endpoints for session/checkpoint queries
 """
 
-from fastapi import APIRouter, HTTPException
+import asyncio
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 from typing import Optional, List, Any
-from datetime import datetime
-from lgp.checkpointing import create_checkpointer
+from api.responses import SafeORJSONResponse
 
 
 router = APIRouter(prefix="/sessions", tags=["sessions"])
@@ -20,45 +20,68 @@ class SessionResponse(BaseModel):
     created_at: Optional[str] = None
 
 
-@router.get("/{thread_id}")
-async def get_session(thread_id: str):
+async def count_checkpoints(checkpointer, thread_id: str) -> int:
+    """Count checkpoints for a thread with a single SQL query
+
+    Avoids iterating (and deserializing) every checkpoint via alist().
+
+    Args:
+        checkpointer: AsyncSqliteSaver with an open aiosqlite connection
+        thread_id: Thread ID to count
+
+    Returns:
+        Number of checkpoints stored for the thread
+    """
+    rows = await checkpointer.conn.execute_fetchall(
+        "SELECT COUNT(*) FROM checkpoints WHERE thread_id = ?",
+        (thread_id,)
+    )
+    return rows[0][0]
+
+
+@router.get(
+    "/{thread_id}",
+    response_model=SessionResponse,
+    response_model_exclude_none=True
+)
+async def get_session(thread_id: str, request: Request):
     """Get session state and checkpoint history
 
     Args:
         thread_id: Thread ID to query
+        request: Incoming request (provides the shared checkpointer)
 
     Returns:
-        SessionResponse with checkpoint count and latest state
+        SessionResponse with checkpoint count and latest state (unset
+        fields are omitted for threads without checkpoints)
     """
     try:
-        # Create checkpointer
-        checkpointer_cm = create_checkpointer({"path": "./checkpoints.db"})
-
-        async with checkpointer_cm as checkpointer:
-            # Get latest checkpoint
-            config = {"configurable": {"thread_id": thread_id}}
-            checkpoint_tuple = await checkpointer.aget_tuple(config)
-
-            if checkpoint_tuple:
-                # Count total checkpoints for this thread
-                checkpoint_count = 0
-                async for _ in checkpointer.alist(config):
-                    checkpoint_count += 1
-
-                return SessionResponse(
-                    thread_id=thread_id,
-                    checkpoints=checkpoint_count,
-                    latest_state=checkpoint_tuple.checkpoint.get("channel_values", {}),
-                    created_at=checkpoint_tuple.checkpoint.get("ts")
-                )
-            else:
-                # No checkpoints found for this thread
-                return SessionResponse(
-                    thread_id=thread_id,
-                    checkpoints=0,
-                    latest_state=None,
-                    created_at=None
-                )
+        # Borrow the checkpointer opened at startup
+        checkpointer = request.app.state.checkpointer
+
+        # Fetch latest checkpoint and total count together instead of
+        # waiting for one query before issuing the other
+        config = {"configurable": {"thread_id": thread_id}}
+        checkpoint_tuple, checkpoint_count = await asyncio.gather(
+            checkpointer.aget_tuple(config),
+            count_checkpoints(checkpointer, thread_id)
+        )
+
+        if checkpoint_tuple:
+            return SessionResponse(
+                thread_id=thread_id,
+                checkpoints=checkpoint_count,
+                latest_state=checkpoint_tuple.checkpoint.get("channel_values", {}),
+                created_at=checkpoint_tuple.checkpoint.get("ts")
+            )
+        else:
+            # No checkpoints found for this thread
+            return SessionResponse(
+                thread_id=thread_id,
+                checkpoints=0,
+                latest_state=None,
+                created_at=None
+            )
 
     except Exception as e:
         raise HTTPException(
@@ -71,43 +94,40 @@ async def get_session(thread_id: str):
 
 
 @router.get("/{thread_id}/checkpoints")
-async def list_checkpoints(thread_id: str, limit: int = 10):
+async def list_checkpoints(thread_id: str, request: Request, limit: int = 10):
     """List checkpoints for a session
 
     Args:
         thread_id: Thread ID to query
+        request: Incoming request (provides the shared checkpointer)
         limit: Maximum number of checkpoints to return
 
     Returns:
         List of checkpoints
     """
     try:
-        # Create checkpointer
-        checkpointer_cm = create_checkpointer({"path": "./checkpoints.db"})
-
-        async with checkpointer_cm as checkpointer:
-            config = {"configurable": {"thread_id": thread_id}}
-
-            # List checkpoints
-            checkpoints = []
-            count = 0
-            async for checkpoint_tuple in checkpointer.alist(config):
-                if count >= limit:
-                    break
-
-                checkpoints.append({
-                    "checkpoint_id": checkpoint_tuple.checkpoint.get("id"),
-                    "state": checkpoint_tuple.checkpoint.get("channel_values", {}),
-                    "timestamp": checkpoint_tuple.checkpoint.get("ts"),
-                    "parent_id": checkpoint_tuple.parent_config.get("configurable", {}).get("checkpoint_id") if checkpoint_tuple.parent_config else None
-                })
-                count += 1
-
-            return {
-                "thread_id": thread_id,
-                "checkpoints": checkpoints,
-                "count": len(checkpoints)
-            }
+        # Borrow the checkpointer opened at startup
+        checkpointer = request.app.state.checkpointer
+
+        config = {"configurable": {"thread_id": thread_id}}
+
+        # List checkpoints (limit is applied in SQL by the checkpointer)
+        checkpoints = []
+        async for checkpoint_tuple in checkpointer.alist(config, limit=limit):
+            checkpoints.append({
+                "checkpoint_id": checkpoint_tuple.checkpoint.get("id"),
+                "state": checkpoint_tuple.checkpoint.get("channel_values", {}),
+                "timestamp": checkpoint_tuple.checkpoint.get("ts"),
+                "parent_id": checkpoint_tuple.parent_config.get("configurable", {}).get("checkpoint_id") if checkpoint_tuple.parent_config else None
+            })
+
+        # Plain dict payload: skip response-model validation and encode
+        # directly with orjson
+        return SafeORJSONResponse(content={
+            "thread_id": thread_id,
+            "checkpoints": checkpoints,
+            "count": len(checkpoints)
+        })
 
     except Exception as e:
         raise HTTPException(
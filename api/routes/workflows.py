@@ -5,6 +5,8 @@ Workflow Routes - HTTP endpoints for workflow invocation
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
+from api.responses import SafeORJSONResponse
+import orjson
 import time
 
 
@@ -26,22 +28,73 @@ class InvokeResponse(BaseModel):
     duration_ms: float
 
 
-@router.post("/{workflow_name}/invoke")
-async def invoke_workflow(
-    workflow_name: str,
-    request_body: InvokeRequest,
-    request: Request
-):
+def _parse_invoke_body(raw: bytes) -> Dict[str, Any]:
+    """Decode and validate an invoke request body
+
+    Only the small top-level fields are checked; 'input' is passed through
+    untouched so large payloads are decoded once by orjson and never
+    re-validated by Pydantic.
+
+    Args:
+        raw: Raw request body bytes
+
+    Returns:
+        Decoded request body
+
+    Raises:
+        HTTPException: 422 if the body does not match InvokeRequest
+    """
+    try:
+        body = orjson.loads(raw)
+    except orjson.JSONDecodeError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid JSON body: {e}")
+
+    if not isinstance(body, dict) or "input" not in body:
+        raise HTTPException(
+            status_code=422,
+            detail="Request body must be a JSON object with an 'input' field"
+        )
+
+    thread_id = body.get("thread_id")
+    if thread_id is not None and not isinstance(thread_id, str):
+        raise HTTPException(status_code=422, detail="'thread_id' must be a string")
+
+    config = body.get("config")
+    if config is not None and not isinstance(config, dict):
+        raise HTTPException(status_code=422, detail="'config' must be an object")
+
+    return body
+
+
+@router.post(
+    "/{workflow_name}/invoke",
+    responses={200: {"model": InvokeResponse}},
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": InvokeRequest.model_json_schema()}
+            }
+        }
+    }
+)
+async def invoke_workflow(workflow_name: str, request: Request):
     """Invoke workflow with input data
 
+    The body (see InvokeRequest) is read and decoded directly with orjson
+    instead of going through Pydantic model validation.
+
     Args:
         workflow_name: Name of the workflow to invoke
-        request_body: Input data and configuration
+        request: Incoming request carrying the InvokeRequest JSON body
 
     Returns:
         InvokeResponse with result and metadata
     """
-    start_time = time.time()
+    request_body = _parse_invoke_body(await request.body())
+    thread_id = request_body.get("thread_id")
+
+    start_ns = time.perf_counter_ns()
 
     try:
         # Get workflow path from app state
@@ -55,29 +108,28 @@ async def invoke_workflow(
                        f"Available: {request.app.state.workflow_name}"
             )
 
-        # Create executor
-        from runtime.executor import WorkflowExecutor
-        executor = WorkflowExecutor(environment="hosted")
+        # Reuse the executor created at startup
+        executor = request.app.state.executor
 
         # Prepare input
-        input_data = {"input": request_body.input}
-        if request_body.thread_id:
-            input_data["thread_id"] = request_body.thread_id
+        input_data = {"input": request_body["input"]}
+        if thread_id:
+            input_data["thread_id"] = thread_id
 
         # Execute workflow
         result = await executor.aexecute(workflow_path, input_data)
 
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
-        return InvokeResponse(
-            status="complete",
-            thread_id=request_body.thread_id,
-            result=result,
-            duration_ms=duration_ms
-        )
+        return SafeORJSONResponse(content={
+            "status": "complete",
+            "thread_id": thread_id,
+            "result": result,
+            "duration_ms": duration_ms
+        })
 
     except Exception as e:
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         raise HTTPException(
             status_code=500,
@@ -0,0 +1,11 @@
+"""
+Allow running the CLI as a module: python -m cli
+
+Only Click and cli.main are imported here; runtime dependencies (fastapi,
+uvicorn, langgraph) are imported inside the individual commands.
+"""
+
+from cli.main import cli
+
+if __name__ == '__main__':
+    cli(prog_name="lgp")
@@ -6,10 +6,43 @@ Creates a new workflow from a template with parameterization.
 
 import os
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 
+@lru_cache(maxsize=1)
+def _find_project_root() -> Optional[Path]:
+    """
+    Locate the project root (directory containing cli/ and templates/).
+
+    Walks up from this file once per process; the result is cached.
+
+    Returns:
+        Project root path, or None if not found
+    """
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current / "cli").exists() and (current / "templates").exists():
+            return current
+        current = current.parent
+    return None
+
+
+@lru_cache(maxsize=8)
+def _read_template_file(template_file: Path) -> bytes:
+    """
+    Read template file bytes (cached per path).
+
+    Args:
+        template_file: Path to template workflow.py
+
+    Returns:
+        Raw template file content
+    """
+    return template_file.read_bytes()
+
+
 class TemplateManager:
     """Manages workflow template operations"""
 
@@ -25,12 +58,7 @@ class TemplateManager:
         """
         if project_root is None:
             # Auto-detect project root (look for cli/ directory)
-            current = Path(__file__).resolve()
-            while current.parent != current:
-                if (current / "cli").exists() and (current / "templates").exists():
-                    project_root = current
-                    break
-                current = current.parent
+            project_root = _find_project_root()
 
         self.project_root = project_root
         self.templates_dir = project_root / "templates"
@@ -118,8 +146,7 @@ class TemplateManager:
             raise ValueError(f"Template file not found: {template_file}")
 
         # Read template content
-        with open(template_file, 'r') as f:
-            template_content = f.read()
+        template_content = self._read_template(template_name)
 
         # Parameterize template (simple string replacement for now)
         # Future: Add Jinja2 templating if more complex parameterization needed
@@ -132,24 +159,49 @@ class TemplateManager:
         # Ensure workflows directory exists
         self.workflows_dir.mkdir(parents=True, exist_ok=True)
 
-        # Write workflow file
+        # Write workflow file atomically (temp file + rename) so a crash
+        # never leaves a partially written workflow behind
         workflow_path = self.workflows_dir / f"{workflow_name}.py"
-        with open(workflow_path, 'w') as f:
-            f.write(workflow_content)
+        tmp_path = workflow_path.with_suffix(".py.tmp")
+        try:
+            if workflow_content is template_content:
+                # Nothing substituted: let the kernel copy the file
+                shutil.copyfile(template_file, tmp_path)
+            else:
+                tmp_path.write_bytes(workflow_content)
+            os.replace(tmp_path, workflow_path)
+        except BaseException:
+            # Don't leave the partial temp file next to the workflows
+            tmp_path.unlink(missing_ok=True)
+            raise
 
         return workflow_path
 
+    def _read_template(self, template_name: str) -> bytes:
+        """
+        Read template content (cached across TemplateManager instances).
+
+        Args:
+            template_name: Name of the template
+
+        Returns:
+            Raw template file content
+        """
+        return _read_template_file(self.get_template_path(template_name) / "workflow.py")
+
     def _parameterize_template(
         self,
-        content: str,
+        content: bytes,
         workflow_name: str,
         template_name: str
-    ) -> str:
+    ) -> bytes:
         """
         Parameterize template content with workflow-specific values.
 
+        Content stays as bytes; decode only once real substitution is needed.
+
         Args:
-            content: Template file content
+            content: Raw template file content
             workflow_name: Name of the workflow being created
             template_name: Name of the template used
 
@@ -5,7 +5,6 @@ Main entry point for all commands: run, serve, create, deploy
 """
 
 import click
-from pathlib import Path
 
 
 @click.group()
@@ -79,7 +78,8 @@ def run(workflow: str, watch: bool, verbose: bool, input_data: str):
 @click.argument('workflow', type=click.Path(exists=True))
 @click.option('--port', default=8000, help='Port to run server on')
 @click.option('--host', default='0.0.0.0', help='Host to bind to')
-def serve(workflow: str, port: int, host: str):
+@click.option('--workers', default=1, type=click.IntRange(min=1), help='Number of worker processes')
+def serve(workflow: str, port: int, host: str, workers: int):
     """Start workflow API server (hosted mode)
 
     WORKFLOW: Path to workflow Python file
@@ -87,6 +87,7 @@ def serve(workflow: str, port: int, host: str):
     Examples:
         lgp serve workflows/my_workflow.py
         lgp serve workflows/my_workflow.py --port 8001
+        lgp serve workflows/my_workflow.py --workers 4
     """
     from runtime.server import serve_workflow
 
@@ -96,7 +97,7 @@ def serve(workflow: str, port: int, host: str):
     click.echo(f"[lgp] Server: http://{host}:{port}")
     click.echo()
 
-    serve_workflow(workflow, host=host, port=port)
+    serve_workflow(workflow, host=host, port=port, workers=workers)
 
 
 @cli.command()
@@ -0,0 +1,177 @@
+"""
+Reference implementations of the functions in algorithm.py.
+
+algorithm.py stays intentionally inefficient because it is the target of the
+optimize-evaluate workflow. This module is the baseline to compare the
+optimizer's output against (and what benchmark harnesses should import).
+"""
+
+from collections import Counter
+from functools import lru_cache
+from math import gcd, isqrt, prod
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+# Below this size Counter beats the cost of converting to an ndarray
+_NUMPY_MIN_SIZE = 100_000
+
+# is_prime answers n below this bound with a single bit test
+_PRIME_TABLE_LIMIT = 1 << 15
+
+
+def _build_prime_bits(limit: int) -> bytearray:
+    """Sieve of Eratosthenes packed into a bitset (bit n set iff n is prime)"""
+    sieve = bytearray([1]) * limit
+    sieve[0:2] = b"\x00\x00"
+    for i in range(2, isqrt(limit - 1) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytes(len(range(i * i, limit, i)))
+
+    bits = bytearray(limit >> 3)
+    for n in range(limit):
+        if sieve[n]:
+            bits[n >> 3] |= 1 << (n & 7)
+    return bits
+
+
+_PRIME_BITS = _build_prime_bits(_PRIME_TABLE_LIMIT)
+
+
+def find_duplicates(numbers: list[int]) -> list[int]:
+    """
+    Find all duplicate numbers in a list in O(n).
+
+    Large inputs go through numpy when it is installed; both paths return
+    the same list.
+
+    Args:
+        numbers: List of integers
+
+    Returns:
+        List of duplicate numbers (without duplicates in result), in order
+        of first appearance (as algorithm.find_duplicates returns them)
+
+    Examples:
+        >>> find_duplicates([1, 2, 3, 2, 4, 3])
+        [2, 3]
+        >>> find_duplicates([1, 2, 3, 4, 5])
+        []
+        >>> find_duplicates([1, 1, 1, 1])
+        [1]
+    """
+    if np is not None and len(numbers) >= _NUMPY_MIN_SIZE:
+        values, first_seen, counts = np.unique(
+            np.asarray(numbers), return_index=True, return_counts=True
+        )
+        repeated = counts > 1
+        # np.unique sorts by value; restore first-appearance order
+        order = np.argsort(first_seen[repeated], kind="stable")
+        return values[repeated][order].tolist()
+
+    return [x for x, count in Counter(numbers).items() if count > 1]
+
+
+def _fib_pair(n: int) -> tuple[int, int]:
+    """Return (F(n), F(n + 1)) using the fast-doubling identities.
+
+    Walks the bits of n from the most significant down, so there is no
+    recursion (and no recursion limit) regardless of n.
+    """
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * ((b << 1) - a)  # F(2k) = F(k) * (2F(k+1) - F(k))
+        d = a * a + b * b       # F(2k+1) = F(k)^2 + F(k+1)^2
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a, b
+
+
+@lru_cache(maxsize=256)
+def fibonacci(n: int) -> int:
+    """
+    Calculate nth Fibonacci number in O(log n) multiplications.
+
+    Results are memoized, so repeated lookups (e.g. building a sequence)
+    cost a dict hit.
+
+    Args:
+        n: Position in Fibonacci sequence (0-indexed)
+
+    Returns:
+        nth Fibonacci number
+
+    Examples:
+        >>> fibonacci(0)
+        0
+        >>> fibonacci(1)
+        1
+        >>> fibonacci(10)
+        55
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    return _fib_pair(n)[0]
+
+
+# Miller-Rabin witnesses; this set is exact for every n < 3.3 * 10^24
+_MR_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+# Product of the odd primes below 100: one gcd() rejects any n with a small
+# odd factor, instead of a Python-level % per prime
+_ODD_PRIMORIAL_100 = prod(p for p in range(3, 100) if _PRIME_BITS[p >> 3] & (1 << (p & 7)))
+
+
+def _is_strong_probable_prime(n: int, a: int, d: int, s: int) -> bool:
+    """Miller-Rabin round for witness a, where n - 1 = d * 2^s and d is odd"""
+    x = pow(a, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+
+def is_prime(n: int) -> bool:
+    """
+    Check if a number is prime.
+
+    Values below 2^15 are looked up in a precomputed bitset (4 KB); larger
+    values use Miller-Rabin with the first twelve primes as witnesses,
+    which is deterministic for n < 3.3 * 10^24 (beyond that a composite
+    could in principle pass, though none is known to).
+
+    Args:
+        n: Number to check
+
+    Returns:
+        True if prime, False otherwise
+
+    Examples:
+        >>> is_prime(2)
+        True
+        >>> is_prime(17)
+        True
+        >>> is_prime(4)
+        False
+    """
+    if n < 2:
+        return False
+    if n < _PRIME_TABLE_LIMIT:
+        return bool(_PRIME_BITS[n >> 3] & (1 << (n & 7)))
+    if not n & 1 or gcd(n, _ODD_PRIMORIAL_100) != 1:
+        return False
+
+    # Deterministic Miller-Rabin: write n - 1 = d * 2^s with d odd
+    d, s = n - 1, 0
+    while d & 1 == 0:
+        d >>= 1
+        s += 1
+    return all(_is_strong_probable_prime(n, a, d, s) for a in _MR_WITNESSES)
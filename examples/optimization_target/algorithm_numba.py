@@ -0,0 +1,97 @@
+"""
+Numba-compiled variants of the integer kernels in algorithm_fast.py.
+
+Requires numba and numpy (pip install numba). Functions are compiled with
+cache=True, so the machine code is written next to this file on first use
+and later processes skip JIT warmup. Call warmup() once before timing
+anything.
+
+These work on fixed-width int64 values, unlike the pure-Python versions
+which accept arbitrary-precision ints.
+"""
+
+import numpy as np
+from numba import njit
+
+# F(92) is the largest Fibonacci number that fits in an int64
+MAX_FIBONACCI_N = 92
+
+
+@njit(cache=True)
+def is_prime_nb(n):
+    """6k±1 trial division on int64 values"""
+    if n < 2:
+        return False
+    if n < 4:
+        return True
+    if n % 2 == 0 or n % 3 == 0:
+        return False
+    i = 5
+    while i <= n // i:  # i * i would overflow int64 near the top of the range
+        if n % i == 0 or n % (i + 2) == 0:
+            return False
+        i += 6
+    return True
+
+
+@njit(cache=True)
+def _fibonacci_nb(n):
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+def fibonacci_nb(n: int) -> int:
+    """
+    Iterative Fibonacci on int64 values.
+
+    Args:
+        n: Position in Fibonacci sequence (0 <= n <= 92)
+
+    Returns:
+        nth Fibonacci number
+
+    Raises:
+        ValueError: If n is negative or the result would overflow int64
+    """
+    if not 0 <= n <= MAX_FIBONACCI_N:
+        raise ValueError(f"n must be between 0 and {MAX_FIBONACCI_N}")
+    return int(_fibonacci_nb(n))
+
+
+@njit(cache=True)
+def _find_duplicates_sorted(values):
+    # values is sorted: duplicates are adjacent runs
+    out = np.empty(values.shape[0] // 2, dtype=values.dtype)
+    count = 0
+    i = 1
+    while i < values.shape[0]:
+        if values[i] == values[i - 1]:
+            out[count] = values[i]
+            count += 1
+            while i < values.shape[0] and values[i] == values[i - 1]:
+                i += 1
+        i += 1
+    return out[:count]
+
+
+def find_duplicates_nb(numbers) -> list[int]:
+    """
+    Find duplicate values with a sort plus one compiled pass.
+
+    Args:
+        numbers: Sequence or array of integers
+
+    Returns:
+        Sorted list of duplicate numbers (without duplicates in result)
+    """
+    values = np.sort(np.asarray(numbers, dtype=np.int64))
+    return _find_duplicates_sorted(values).tolist()
+
+
+def warmup() -> None:
+    """Compile (or load from cache) every kernel before timing-sensitive use"""
+    is_prime_nb(9973)
+    _fibonacci_nb(20)
+    _find_duplicates_sorted(np.array([1, 1], dtype=np.int64))
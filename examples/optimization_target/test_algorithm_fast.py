@@ -0,0 +1,114 @@
+"""
+Test suite for algorithm_fast.py
+
+Checks the reference implementations against the original (slow) ones
+and against inputs too large for the slow versions.
+"""
+
+import pytest
+import time
+
+import algorithm
+import algorithm_fast
+from algorithm_fast import find_duplicates, fibonacci, is_prime
+
+
+class TestFindDuplicates:
+    """Test cases for find_duplicates function."""
+
+    def test_basic_duplicates(self):
+        """Should find duplicates in basic list."""
+        assert set(find_duplicates([1, 2, 3, 2, 4, 3])) == {2, 3}
+
+    def test_edge_cases(self):
+        """Should handle empty, single and all-same lists."""
+        assert find_duplicates([]) == []
+        assert find_duplicates([5]) == []
+        assert find_duplicates([1, 1, 1, 1]) == [1]
+
+    def test_matches_original(self):
+        """Should agree with the original implementation."""
+        numbers = [i % 37 for i in range(100)] + list(range(200, 250))
+        assert set(find_duplicates(numbers)) == set(algorithm.find_duplicates(numbers))
+
+    def test_large_input(self):
+        """Should handle inputs far beyond the O(n²) version's reach."""
+        numbers = list(range(200_000)) + [7, 42]
+        start = time.time()
+        result = find_duplicates(numbers)
+        duration = time.time() - start
+
+        assert sorted(result) == [7, 42]
+        assert duration < 1.0
+
+    def test_first_appearance_order_counter(self, monkeypatch):
+        """Counter path should return duplicates in order of first appearance."""
+        monkeypatch.setattr(algorithm_fast, "np", None)
+        numbers = [9, 3, 9, 1, 3, 7, 1, 1, -2, -2]
+        assert find_duplicates(numbers) == algorithm.find_duplicates(numbers) == [9, 3, 1, -2]
+
+    def test_first_appearance_order_numpy(self, monkeypatch):
+        """numpy path should return the same list as the Counter path."""
+        pytest.importorskip("numpy")
+        numbers = [9, 3, 9, 1, 3, 7, 1, 1, -2, -2] + list(range(100, 1000)) + [500]
+        expected = algorithm.find_duplicates(numbers)
+        monkeypatch.setattr(algorithm_fast, "_NUMPY_MIN_SIZE", 0)
+        assert find_duplicates(numbers) == expected == [9, 3, 1, -2, 500]
+
+
+class TestFibonacci:
+    """Test cases for fibonacci function."""
+
+    def test_sequence(self):
+        """Should agree with the original implementation."""
+        assert [fibonacci(i) for i in range(25)] == [algorithm.fibonacci(i) for i in range(25)]
+
+    def test_large_n(self):
+        """Should satisfy the recurrence for large n."""
+        assert fibonacci(1000) + fibonacci(1001) == fibonacci(1002)
+        assert fibonacci(100) == 354224848179261915075
+
+    def test_negative(self):
+        """Should reject negative positions."""
+        with pytest.raises(ValueError):
+            fibonacci(-1)
+
+
+class TestIsPrime:
+    """Test cases for is_prime function."""
+
+    def test_matches_original(self):
+        """Should agree with the original implementation."""
+        for n in range(-5, 1000):
+            assert is_prime(n) is algorithm.is_prime(n), n
+
+    def test_table_boundary(self):
+        """Should agree on both sides of the precomputed prime table."""
+        assert sum(is_prime(n) for n in range(32768)) == 3512
+        assert is_prime(32749) is True   # largest prime below 2^15
+        assert is_prime(32771) is True   # smallest prime above 2^15
+        assert is_prime(32767) is False  # 7 * 31 * 151
+
+    def test_large_values(self):
+        """Should classify large primes, composites and squares of primes."""
+        assert is_prime(1_000_000_007) is True
+        assert is_prime(2_147_483_647) is True  # Mersenne prime 2^31 - 1
+        assert is_prime(1_000_000_007 * 3) is False
+        assert is_prime(65_521 * 65_521) is False
+
+    def test_pseudoprimes(self):
+        """Should reject Carmichael numbers and strong pseudoprimes."""
+        assert is_prime(561) is False
+        assert is_prime(41041) is False
+        assert is_prime(3_215_031_751) is False  # strong pseudoprime to bases 2, 3, 5, 7
+
+    def test_64_bit(self):
+        """Should handle values near the 64-bit limit."""
+        assert is_prime(2**61 - 1) is True  # Mersenne prime
+        assert is_prime(2**64 - 59) is True  # largest 64-bit prime
+        assert is_prime((2**31 - 1) * (2**61 - 1)) is False
+
+
+if __name__ == "__main__":
+    # Run tests with pytest
+    pytest.main([__file__, "-v"])
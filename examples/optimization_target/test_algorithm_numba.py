@@ -0,0 +1,68 @@
+"""
+Test suite for algorithm_numba.py
+
+Checks the compiled kernels against the reference implementations in
+algorithm_fast.py. Skipped when numba is not installed.
+"""
+
+import pytest
+
+pytest.importorskip("numba")
+
+from algorithm_fast import find_duplicates, fibonacci, is_prime
+from algorithm_numba import (
+    MAX_FIBONACCI_N,
+    fibonacci_nb,
+    find_duplicates_nb,
+    is_prime_nb,
+)
+
+
+class TestIsPrimeNb:
+    """Test cases for is_prime_nb."""
+
+    def test_matches_fast(self):
+        """Should agree with algorithm_fast.is_prime."""
+        for n in range(-5, 5000):
+            assert is_prime_nb(n) is is_prime(n), n
+
+    def test_large_values(self):
+        """Should agree on large primes and composites."""
+        for n in (1_000_000_007, 2_147_483_647, 1_000_000_007 * 3, 65_521 * 65_521):
+            assert is_prime_nb(n) is is_prime(n), n
+
+    def test_int64_limit(self):
+        """Should not overflow when trial division runs to the top of int64."""
+        n = 2**63 - 25  # largest prime below 2^63
+        assert is_prime_nb(n) is is_prime(n) is True
+
+
+class TestFibonacciNb:
+    """Test cases for fibonacci_nb."""
+
+    def test_matches_fast(self):
+        """Should agree with algorithm_fast.fibonacci up to the int64 limit."""
+        for n in range(MAX_FIBONACCI_N + 1):
+            assert fibonacci_nb(n) == fibonacci(n), n
+
+    def test_out_of_range(self):
+        """Should reject positions whose result overflows int64."""
+        with pytest.raises(ValueError):
+            fibonacci_nb(MAX_FIBONACCI_N + 1)
+        with pytest.raises(ValueError):
+            fibonacci_nb(-1)
+
+
+class TestFindDuplicatesNb:
+    """Test cases for find_duplicates_nb."""
+
+    def test_matches_fast(self):
+        """Should find the same duplicates as algorithm_fast (sorted)."""
+        numbers = [i % 37 for i in range(100)] + list(range(200, 250)) + [-3, -3]
+        assert find_duplicates_nb(numbers) == sorted(find_duplicates(numbers))
+
+    def test_edge_cases(self):
+        """Should handle empty, single and all-same inputs."""
+        assert find_duplicates_nb([]) == []
+        assert find_duplicates_nb([5]) == []
+        assert find_duplicates_nb([1, 1, 1, 1]) == [1]
@@ -15,8 +15,13 @@ class LLMProvider(ABC):
 
     All providers (Claude Code, Ollama, GPT, etc.) must implement this interface
     to be compatible with LangGraph workflow injection.
+
+    Declares empty __slots__ so subclasses that list their own slots get
+    instances without a per-instance __dict__.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def execute_task(
         self,
@@ -9,6 +9,30 @@ from typing import Dict, Any, Callable
 from lgp.agents.base import LLMProvider
 from lgp.agents.ollama_provider import OllamaProvider
 
+# provider_type -> builder(config, provider_config) returning a node function
+_PROVIDER_REGISTRY: Dict[str, Callable[[Dict[str, Any], Dict[str, Any]], Callable]] = {}
+
+
+def register_provider(name: str) -> Callable:
+    """
+    Decorator registering a node builder for a provider type.
+
+    Args:
+        name: Provider identifier used in llm_providers config
+
+    Returns:
+        Decorator that registers and returns the builder unchanged
+
+    Example:
+        @register_provider("my_llm")
+        def create_my_llm_node(config, provider_config):
+            ...
+    """
+    def decorator(builder: Callable) -> Callable:
+        _PROVIDER_REGISTRY[name] = builder
+        return builder
+    return decorator
+
 
 def create_agent_node(
     provider_type: str,
@@ -51,22 +75,18 @@ def create_agent_node(
         )
 
     # Dispatch to correct provider
-    if provider_type == "ollama":
-        return create_ollama_node(config, provider_config)
-    elif provider_type == "claude_code":
-        # Import here to avoid circular dependency
-        from lgp.claude_code.node_factory import create_claude_code_node as create_cc_node
-        from lgp.claude_code.session_manager import get_default_manager
-
-        # Claude Code uses MCP manager, not provider_config
-        return create_cc_node(config, get_default_manager())
-    else:
+    try:
+        builder = _PROVIDER_REGISTRY[provider_type]
+    except KeyError:
         raise ValueError(
             f"Unknown provider: '{provider_type}'. "
-            f"Supported providers: ollama, claude_code"
-        )
+            f"Supported providers: {', '.join(_PROVIDER_REGISTRY)}"
+        ) from None
 
+    return builder(config, provider_config)
 
+
+@register_provider("ollama")
 def create_ollama_node(
     config: Dict[str, Any],
     provider_config: Dict[str, Any]
@@ -82,7 +102,8 @@ def create_ollama_node(
         Async function for LangGraph node
     """
     # Extract Ollama-specific settings from provider config
-    base_url = provider_config.get("base_url", "http://localhost:11434/v1")
+    # (None lets the provider fall back to OLLAMA_BASE_URL)
+    base_url = provider_config.get("base_url")
     default_model = provider_config.get("default_model", "llama3.2")
 
     # Use model from config, fall back to default
@@ -92,6 +113,13 @@ def create_ollama_node(
     # Create provider instance
     provider = OllamaProvider(config, base_url=base_url)
 
+    # Per-role constants, computed once per node rather than per execution
+    task_key = provider.task_key
+    no_task_updates = {
+        provider.output_key: f"No task provided for {provider.role_name}",
+        provider.session_key: "no-session"
+    }
+
     # Return async node function that matches LangGraph signature
     async def ollama_node(state: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -106,18 +134,12 @@ def create_ollama_node(
         Returns:
             State updates from provider execution
         """
-        role_name = config["role_name"]
-        task_key = f"{role_name}_task"
-
         # Get task from state
         task = state.get(task_key, "")
 
         if not task:
             # No task provided - return empty output
-            return {
-                f"{role_name}_output": f"No task provided for {role_name}",
-                f"{role_name}_session_id": "no-session"
-            }
+            return dict(no_task_updates)
 
         # Execute task via Ollama provider
         state_updates = await provider.execute_task(
@@ -129,3 +151,27 @@ def create_ollama_node(
         return state_updates
 
     return ollama_node
+
+
+@register_provider("claude_code")
+def create_claude_code_agent_node(
+    config: Dict[str, Any],
+    provider_config: Dict[str, Any]
+) -> Callable:
+    """
+    Create Claude Code agent node.
+
+    Claude Code uses the MCP session manager, not provider_config.
+
+    Args:
+        config: Agent configuration with role_name, repository, timeout
+        provider_config: Claude Code provider configuration from YAML (unused)
+
+    Returns:
+        Async function for LangGraph node
+    """
+    # Import here to avoid circular dependency
+    from lgp.claude_code.node_factory import create_claude_code_node
+    from lgp.claude_code.session_manager import get_default_manager
+
+    return create_claude_code_node(config, get_default_manager())
@@ -11,11 +11,89 @@ Key Features:
 - Multiple model support (Llama 3.2, Mistral, Gemma, etc.)
 """
 
+import asyncio
 import os
-from typing import Dict, Any, Optional
-from langfuse import observe
-from langfuse.openai import OpenAI
+import threading
+import time
+import weakref
+from typing import Dict, Any, Optional, Tuple
+from dotenv import load_dotenv
+from langfuse.openai import AsyncOpenAI, OpenAI
 from lgp.agents.base import LLMProvider
+from lgp.observability import observe
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Resolved once at import rather than per provider instance
+DEFAULT_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434/v1")
+_API_KEY = os.getenv("OLLAMA_API_KEY", "ollama")  # Dummy key for Ollama
+
+# Shared by every request; only the user message is built per call
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an expert software engineer helping with code optimization and testing."
+}
+
+# is_available() results per (base_url, model), as (checked_at, available).
+# A probe is a full (if tiny) completion, so repeat checks within the TTL
+# reuse the last answer.
+_AVAILABILITY_CACHE: Dict[Tuple[str, str], Tuple[float, bool]] = {}
+_AVAILABILITY_LOCK = threading.Lock()
+_AVAILABILITY_TTL = 30.0  # seconds
+
+# One client (and so one httpx connection pool) per endpoint, shared by
+# every provider instance talking to that Ollama server. The async client's
+# pool is bound to the event loop it first ran on, so async clients are kept
+# per loop (and dropped with it); WorkflowExecutor.execute() and hot reload
+# start a fresh loop for each run.
+_SYNC_CLIENTS: Dict[str, OpenAI] = {}
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, AsyncOpenAI]]" = (
+    weakref.WeakKeyDictionary()
+)
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_sync_client(base_url: str) -> OpenAI:
+    """
+    Return the shared sync client for base_url, creating it once.
+
+    Args:
+        base_url: Ollama API endpoint
+
+    Returns:
+        Langfuse-wrapped OpenAI client shared across providers
+    """
+    with _CLIENTS_LOCK:
+        client = _SYNC_CLIENTS.get(base_url)
+        if client is None:
+            client = OpenAI(base_url=base_url, api_key=_API_KEY)
+            _SYNC_CLIENTS[base_url] = client
+    return client
+
+
+def _get_async_client(base_url: str) -> AsyncOpenAI:
+    """
+    Return the running loop's async client for base_url, creating it once.
+
+    Must be called from a coroutine.
+
+    Args:
+        base_url: Ollama API endpoint
+
+    Returns:
+        Langfuse-wrapped AsyncOpenAI client shared across providers on
+        this event loop
+    """
+    loop = asyncio.get_running_loop()
+    with _CLIENTS_LOCK:
+        clients = _ASYNC_CLIENTS.get(loop)
+        if clients is None:
+            clients = _ASYNC_CLIENTS[loop] = {}
+        client = clients.get(base_url)
+        if client is None:
+            client = clients[base_url] = AsyncOpenAI(base_url=base_url, api_key=_API_KEY)
+    return client
 
 
 class OllamaProvider(LLMProvider):
@@ -34,28 +112,59 @@ class OllamaProvider(LLMProvider):
         }
     """
 
+    # Providers are created per agent node; slots keep instances small
+    __slots__ = (
+        "role_name",
+        "task_key",
+        "output_key",
+        "session_key",
+        "tokens_key",
+        "model",
+        "timeout",
+        "base_url",
+        "_completion_kwargs",
+    )
+
     def __init__(self, config: Dict[str, Any], base_url: Optional[str] = None):
         """
         Initialize Ollama provider.
 
         Args:
             config: Agent configuration from workflow claude_code_config
-            base_url: Ollama API endpoint (default: http://localhost:11434/v1)
+            base_url: Ollama API endpoint (default: $OLLAMA_BASE_URL, else
+                http://localhost:11434/v1)
         """
         self.role_name = config.get("role_name")
+
+        # State keys this role reads/writes, built once rather than per call
+        self.task_key = f"{self.role_name}_task"
+        self.output_key = f"{self.role_name}_output"
+        self.session_key = f"{self.role_name}_session_id"
+        self.tokens_key = f"{self.role_name}_tokens"
         self.model = config.get("model", "llama3.2")
         self.timeout = config.get("timeout", 120000)  # milliseconds
 
-        # Initialize OpenAI client pointing to Ollama
-        self.base_url = base_url or os.getenv(
-            "OLLAMA_BASE_URL",
-            "http://localhost:11434/v1"
-        )
+        self.base_url = base_url or DEFAULT_BASE_URL
 
-        self.client = OpenAI(
-            base_url=self.base_url,
-            api_key=os.getenv("OLLAMA_API_KEY", "ollama")  # Dummy key for Ollama
-        )
+        # Request fields that never change for this provider are built once;
+        # execute_task only supplies the messages. The timeout is enforced
+        # by the client's HTTP layer.
+        self._completion_kwargs = {
+            "model": self.model,
+            "temperature": 0.7,
+            "max_tokens": 2000,
+            "timeout": self.timeout / 1000
+        }
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        """
+        Async OpenAI client pointing to Ollama, so concurrent agent nodes
+        overlap their requests instead of blocking the loop. Shared with
+        other providers on the same endpoint and event loop to reuse
+        connections; only valid inside a coroutine.
+        """
+        return _get_async_client(self.base_url)
 
     def get_provider_name(self) -> str:
         """Return provider identifier."""
@@ -115,22 +224,12 @@ class OllamaProvider(LLMProvider):
         """
         # Call Ollama via OpenAI-compatible API
         # Langfuse wrapper automatically creates trace span
-        response = self.client.chat.completions.create(
-            model=self.model,
+        response = await self.client.chat.completions.create(
+            **self._completion_kwargs,
             messages=[
-                {
-                    "role": "system",
-                    "content": "You are an expert software engineer helping with code optimization and testing."
-                },
-                {
-                    "role": "user",
-                    "content": task
-                }
-            ],
-            temperature=0.7,
-            max_tokens=2000,
-            # Timeout handling: Ollama doesn't directly support timeout in API
-            # The workflow executor's timeout will catch long-running operations
+                _SYSTEM_MESSAGE,
+                {"role": "user", "content": task}
+            ]
         )
 
         # Extract response
@@ -140,9 +239,9 @@ class OllamaProvider(LLMProvider):
         # Build state updates
         # Key pattern: {role_name}_output, {role_name}_session_id, etc.
         state_updates = {
-            f"{self.role_name}_output": output,
-            f"{self.role_name}_session_id": response.id,  # Response ID as session
-            f"{self.role_name}_tokens": {
+            self.output_key: output,
+            self.session_key: response.id,  # Response ID as session
+            self.tokens_key: {
                 "input": usage.prompt_tokens,
                 "output": usage.completion_tokens,
                 "total": usage.total_tokens,
@@ -156,19 +255,38 @@ class OllamaProvider(LLMProvider):
         """
         Check if Ollama service is running and model is available.
 
+        The result is cached per (base_url, model) for _AVAILABILITY_TTL
+        seconds, so constructing many nodes doesn't probe the server each time.
+
         Returns:
             True if Ollama responds to test query, False otherwise
         """
+        key = (self.base_url, self.model)
+        with _AVAILABILITY_LOCK:
+            cached = _AVAILABILITY_CACHE.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _AVAILABILITY_TTL:
+            return cached[1]
+
         try:
-            # Quick test query
-            response = self.client.chat.completions.create(
+            # Quick test query (sync client, shared like the async one)
+            _get_sync_client(self.base_url).chat.completions.create(
                 model=self.model,
                 messages=[{"role": "user", "content": "test"}],
                 max_tokens=1
             )
-            return True
-        except Exception as e:
-            return False
+            available = True
+        except Exception:
+            available = False
+
+        with _AVAILABILITY_LOCK:
+            _AVAILABILITY_CACHE[key] = (time.monotonic(), available)
+        return available
+
+    @staticmethod
+    def invalidate_availability_cache() -> None:
+        """Forget cached is_available() results (e.g. after starting Ollama)."""
+        with _AVAILABILITY_LOCK:
+            _AVAILABILITY_CACHE.clear()
 
     def __repr__(self) -> str:
         return f"OllamaProvider(role={self.role_name}, model={self.model}, cost=$0.00)"
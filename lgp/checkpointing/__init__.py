@@ -1,8 +1,14 @@
 """Checkpointing module for LangGraph Platform."""
 
-from .factory import create_checkpointer, setup_checkpointer, verify_checkpointer
+from .factory import (
+    SQLITE_CONNECTION_PRAGMAS,
+    create_checkpointer,
+    setup_checkpointer,
+    verify_checkpointer,
+)
 
 __all__ = [
+    "SQLITE_CONNECTION_PRAGMAS",
     "create_checkpointer",
     "setup_checkpointer",
     "verify_checkpointer",
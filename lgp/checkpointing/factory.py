@@ -10,83 +10,266 @@ Based on langgraph-checkpoint-mastery M1.1 implementation.
 """
 
 import os
+import random
 import sqlite3
 import asyncio
 import logging
+import threading
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
-from langgraph.checkpoint.sqlite import SqliteSaver
-from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
-from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Any, List, Optional, Tuple, Union
+
+# Saver modules are imported where each backend is first used: the postgres
+# saver pulls in psycopg/psycopg_pool, which SQLite-only deployments never need
+if TYPE_CHECKING:
+    from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# journal_mode is stored in the database file, so setting it once in
+# setup_checkpointer() sticks. These are per-connection and have to be
+# applied to every connection that writes checkpoints.
+SQLITE_CONNECTION_PRAGMAS = (
+    "PRAGMA busy_timeout=5000",  # wait up to 5s on a lock instead of failing with SQLITE_BUSY
+    "PRAGMA synchronous=NORMAL",  # fsync at checkpoint, not every commit (safe with WAL)
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MB memory-mapped reads
+    "PRAGMA cache_size=-65536",  # 64 MB page cache
+)
+
+# Process-wide circuit breaker for PostgreSQL connections. After
+# _PG_BREAKER_THRESHOLD consecutive failed attempts it opens, and new
+# ResilientPostgresCheckpointers go straight to the SQLite fallback for
+# _PG_BREAKER_COOLDOWN seconds. Then one caller probes ("half_open") while
+# the rest keep falling back; the probe's outcome closes or re-opens it.
+_PG_BREAKER_THRESHOLD = 3
+_PG_BREAKER_COOLDOWN = 30.0
+_PG_BREAKER: Dict[str, Any] = {"state": "closed", "opened_at": 0.0, "failure_count": 0}
+_PG_BREAKER_LOCK = threading.Lock()
+
+
+def _pg_breaker_acquire() -> Optional[str]:
+    """
+    Decide how a new PostgreSQL connection attempt may proceed.
+
+    Returns:
+        "closed" to connect normally, "probe" to make a single probe attempt,
+        or None to skip PostgreSQL and use the SQLite fallback
+    """
+    with _PG_BREAKER_LOCK:
+        state = _PG_BREAKER["state"]
+        if state == "closed":
+            return "closed"
+        if state == "open" and time.monotonic() - _PG_BREAKER["opened_at"] >= _PG_BREAKER_COOLDOWN:
+            _PG_BREAKER["state"] = "half_open"
+            return "probe"
+        # Open and cooling down, or another caller is already probing
+        return None
+
+
+def _pg_breaker_record(success: bool, failures: int = 0) -> None:
+    """
+    Record the outcome of a connection attempt (or retry loop).
+
+    Args:
+        success: Whether a connection was established
+        failures: Number of failed attempts made
+    """
+    with _PG_BREAKER_LOCK:
+        if success:
+            _PG_BREAKER.update(state="closed", failure_count=0)
+            return
+        _PG_BREAKER["failure_count"] += failures
+        if (_PG_BREAKER["state"] == "half_open"
+                or _PG_BREAKER["failure_count"] >= _PG_BREAKER_THRESHOLD):
+            _PG_BREAKER.update(state="open", opened_at=time.monotonic())
+
+
+def _ensure_parent_dir(path: str) -> None:
+    """
+    Create the parent directory of path if it doesn't exist.
+
+    Checked on every call rather than cached: the directory can be removed
+    while the process runs, and mkdir(exist_ok=True) is a single syscall.
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+
+@asynccontextmanager
+async def _tuned_sqlite_saver(path: str) -> AsyncIterator["AsyncSqliteSaver"]:
+    """
+    AsyncSqliteSaver.from_conn_string(path), with WAL and
+    SQLITE_CONNECTION_PRAGMAS applied to the connection before first use.
+
+    Args:
+        path: SQLite database path
+
+    Yields:
+        AsyncSqliteSaver on the tuned connection
+    """
+    import aiosqlite
+    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+    async with aiosqlite.connect(path) as conn:
+        # WAL needs a writable directory next to the database file
+        # (for the -wal and -shm files)
+        await conn.execute("PRAGMA journal_mode=WAL")
+        for pragma in SQLITE_CONNECTION_PRAGMAS:
+            await conn.execute(pragma)
+        yield AsyncSqliteSaver(conn)
+
 
 class ResilientPostgresCheckpointer:
     """
     Async context manager wrapper that adds retry logic and SQLite fallback
     to PostgreSQL checkpointer connections.
+
+    Retries back off exponentially with jitter (0.5-1.5x each delay), so
+    servers restarting together don't reconnect in lockstep. Repeated
+    failures open a process-wide circuit breaker: until its cooldown
+    expires, new instances fall back to SQLite immediately instead of
+    waiting out the retries again.
+
+    The PostgreSQL checkpointer is backed by a connection pool, so concurrent
+    runs sharing it (see WorkflowExecutor(reuse_checkpointer=True)) don't
+    queue on a single connection or reconnect per run. After __aenter__,
+    degraded is True if the SQLite fallback was returned instead.
     """
 
-    def __init__(self, url: str, max_retries: int = 3, retry_delays: list = None):
+    def __init__(
+        self,
+        url: str,
+        max_retries: int = 3,
+        retry_delays: list = None,
+        base_delay: float = 1.0,
+        pool_size: int = 10,
+        pool_timeout: float = 30.0,
+        connect_timeout: float = 5.0
+    ):
         self.url = url
         self.max_retries = max_retries
-        self.retry_delays = retry_delays or [1, 2, 4]
+        # Exponential by default: base_delay, 2 * base_delay, 4 * base_delay, ...
+        self.retry_delays = retry_delays or [base_delay * 2 ** i for i in range(max(max_retries - 1, 1))]
+        self.pool_size = pool_size
+        self.pool_timeout = pool_timeout
+        self.connect_timeout = connect_timeout
+        self.degraded = False
         self._checkpointer = None
+        self._pool = None
         self._postgres_cm = None
 
+    async def _open_pool(self):
+        """
+        Open a connection pool, waiting until its first connection is ready.
+
+        A single direct connection is made first, bounded by connect_timeout:
+        the pool would keep retrying a refused connection for its whole
+        timeout, while this fails straight away so __aenter__ can retry or
+        fall back. pool_timeout only bounds waits for a pooled connection.
+        """
+        from psycopg import AsyncConnection
+        from psycopg.rows import dict_row
+        from psycopg_pool import AsyncConnectionPool
+
+        probe = await AsyncConnection.connect(self.url, connect_timeout=max(1, round(self.connect_timeout)))
+        await probe.close()
+
+        pool = AsyncConnectionPool(
+            self.url,
+            min_size=1,
+            max_size=self.pool_size,
+            timeout=self.pool_timeout,
+            # Same connection settings AsyncPostgresSaver.from_conn_string uses
+            kwargs={"autocommit": True, "prepare_threshold": 0, "row_factory": dict_row},
+            open=False
+        )
+        try:
+            await pool.open(wait=True, timeout=self.connect_timeout)
+        except BaseException:
+            await pool.close()
+            raise
+        return pool
+
     async def __aenter__(self):
         """Attempt PostgreSQL connection with retries, fall back to SQLite on failure."""
+        from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+
+        mode = _pg_breaker_acquire()
+        if mode is None:
+            logger.warning("[lgp] PostgreSQL circuit breaker open, skipping connection attempts")
+            return await self._enter_fallback()
+
+        # Half-open: a single probe, not the full retry schedule
+        attempts = 1 if mode == "probe" else self.max_retries
         last_error = None
 
-        for attempt in range(self.max_retries):
+        for attempt in range(attempts):
             try:
-                logger.info(f"[lgp] Attempting PostgreSQL connection (attempt {attempt + 1}/{self.max_retries})...")
-                self._postgres_cm = AsyncPostgresSaver.from_conn_string(self.url)
-                self._checkpointer = await self._postgres_cm.__aenter__()
-                logger.info(f"[lgp] ✓ PostgreSQL connection established")
+                logger.info(f"[lgp] Attempting PostgreSQL connection (attempt {attempt + 1}/{attempts})...")
+                self._pool = await self._open_pool()
+                self._checkpointer = AsyncPostgresSaver(conn=self._pool)
+                _pg_breaker_record(success=True)
+                logger.info(f"[lgp] ✓ PostgreSQL connection pool established (max {self.pool_size})")
                 return self._checkpointer
 
             except Exception as e:
                 last_error = e
                 logger.warning(
-                    f"[lgp] PostgreSQL connection failed (attempt {attempt + 1}/{self.max_retries}): {type(e).__name__}: {str(e)[:100]}"
+                    f"[lgp] PostgreSQL connection failed (attempt {attempt + 1}/{attempts}): {type(e).__name__}: {str(e)[:100]}"
                 )
 
-                if attempt < self.max_retries - 1:
-                    delay = self.retry_delays[attempt]
-                    logger.info(f"[lgp] Retrying in {delay}s...")
+                if attempt < attempts - 1:
+                    delay = self.retry_delays[min(attempt, len(self.retry_delays) - 1)]
+                    delay *= random.uniform(0.5, 1.5)
+                    logger.info(f"[lgp] Retrying in {delay:.1f}s...")
                     await asyncio.sleep(delay)
 
+            except BaseException:
+                # Cancelled mid-probe: let the next caller probe instead
+                if mode == "probe":
+                    _pg_breaker_record(success=False)
+                raise
+
+        _pg_breaker_record(success=False, failures=attempts)
+
         # All retries exhausted - fall back to SQLite
         logger.error(
-            f"[lgp] ⚠️  PostgreSQL connection failed after {self.max_retries} attempts. "
+            f"[lgp] ⚠️  PostgreSQL connection failed after {attempts} attempts. "
             f"Falling back to SQLite (degraded mode)."
         )
         logger.error(f"[lgp] Last error: {type(last_error).__name__}: {str(last_error)[:200]}")
 
-        # Create fallback SQLite checkpointer
+        return await self._enter_fallback()
+
+    async def _enter_fallback(self):
+        """Open the SQLite fallback checkpointer."""
+        self.degraded = True
         fallback_path = "./checkpoints/fallback.sqlite"
-        Path(fallback_path).parent.mkdir(parents=True, exist_ok=True)
+        _ensure_parent_dir(fallback_path)
 
         logger.warning(
             f"[lgp] Using SQLite fallback: {fallback_path} "
             f"(state will NOT be shared across servers)"
         )
 
-        self._postgres_cm = AsyncSqliteSaver.from_conn_string(fallback_path)
+        self._postgres_cm = _tuned_sqlite_saver(fallback_path)
         self._checkpointer = await self._postgres_cm.__aenter__()
         return self._checkpointer
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Exit the checkpointer context manager."""
-        if self._postgres_cm:
+        """Close the connection pool (or exit the SQLite fallback)."""
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await pool.close()
+        elif self._postgres_cm:
             return await self._postgres_cm.__aexit__(exc_type, exc_val, exc_tb)
         return None
 
 
-def create_checkpointer(config: Dict[str, Any]) -> Union[AsyncSqliteSaver, AsyncPostgresSaver]:
+def create_checkpointer(config: Dict[str, Any]) -> Union["AsyncSqliteSaver", "AsyncPostgresSaver"]:
     """
     Create async checkpointer for async workflow execution.
 
@@ -99,6 +282,10 @@ def create_checkpointer(config: Dict[str, Any]) -> Union[AsyncSqliteSaver, Async
             - type: "sqlite" or "postgresql" (default: "sqlite")
             - path: SQLite database path (for type="sqlite")
             - url: PostgreSQL connection URL (for type="postgresql")
+            - pool_size: Max pooled PostgreSQL connections (default: 10)
+            - pool_timeout: Seconds to wait for a pooled connection (default: 30)
+            - connect_timeout: Seconds to wait when connecting to PostgreSQL
+              (default: 5)
             - async: Use async checkpointer (default: True)
 
     Returns:
@@ -120,10 +307,11 @@ def create_checkpointer(config: Dict[str, Any]) -> Union[AsyncSqliteSaver, Async
         path = config.get("path", "./checkpoints.sqlite")
 
         # Ensure parent directory exists
-        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        _ensure_parent_dir(path)
 
-        # Create AsyncSqliteSaver with database path
-        return AsyncSqliteSaver.from_conn_string(path)
+        # Create AsyncSqliteSaver with database path; every connection gets
+        # WAL + SQLITE_CONNECTION_PRAGMAS whether or not setup ran
+        return _tuned_sqlite_saver(path)
 
     elif checkpointer_type == "postgresql":
         url = config.get("url")
@@ -138,14 +326,43 @@ def create_checkpointer(config: Dict[str, Any]) -> Union[AsyncSqliteSaver, Async
             )
 
         # Return resilient checkpointer with retry logic and SQLite fallback
-        # This context manager will attempt PostgreSQL connection with exponential backoff,
-        # and gracefully degrade to SQLite if all retries fail
-        return ResilientPostgresCheckpointer(url, max_retries=3, retry_delays=[1, 2, 4])
+        # This context manager will attempt PostgreSQL connection with jittered
+        # exponential backoff, and gracefully degrade to SQLite if all retries
+        # fail (or straight away while the circuit breaker is open)
+        return ResilientPostgresCheckpointer(
+            url,
+            max_retries=3,
+            pool_size=int(config.get("pool_size", 10)),
+            pool_timeout=float(config.get("pool_timeout", 30)),
+            connect_timeout=float(config.get("connect_timeout", 5))
+        )
 
     else:
         raise ValueError(f"Unknown checkpointer type: {checkpointer_type}. Use 'sqlite' or 'postgresql'.")
 
 
+def _table_names(cursor: sqlite3.Cursor) -> List[str]:
+    """Names of all tables in the database, in one query"""
+    return [row[0] for row in cursor.execute(
+        "SELECT name FROM sqlite_master WHERE type='table'"
+    )]
+
+
+def _schema_and_journal_mode(cursor: sqlite3.Cursor) -> Tuple[List[str], Optional[str]]:
+    """Table names and journal mode of the database, in one query"""
+    table_names: List[str] = []
+    journal_mode = None
+    for kind, value in cursor.execute(
+        "SELECT 'table', name FROM sqlite_master WHERE type='table' "
+        "UNION ALL SELECT 'journal_mode', journal_mode FROM pragma_journal_mode"
+    ):
+        if kind == 'table':
+            table_names.append(value)
+        else:
+            journal_mode = value
+    return table_names, journal_mode
+
+
 def setup_checkpointer(path: str = "./checkpoints.sqlite", verbose: bool = False) -> bool:
     """
     Setup SQLite checkpointer with schema creation and verification.
@@ -153,7 +370,8 @@ def setup_checkpointer(path: str = "./checkpoints.sqlite", verbose: bool = False
     Creates checkpoints.sqlite file with:
     - checkpoints table
     - writes table
-    - WAL mode enabled
+    - WAL mode enabled (persisted in the file; per-connection tuning is in
+      SQLITE_CONNECTION_PRAGMAS)
 
     Args:
         path: Path to SQLite database file
@@ -170,61 +388,58 @@ def setup_checkpointer(path: str = "./checkpoints.sqlite", verbose: bool = False
     if verbose:
         print(f"[lgp] Setting up checkpointer: {path}")
 
-    try:
-        # Create checkpointer and setup schema
-        with SqliteSaver.from_conn_string(path) as checkpointer:
-            checkpointer.setup()
+    from langgraph.checkpoint.sqlite import SqliteSaver
 
-        if verbose:
-            print(f"[lgp] ✓ Schema created")
+    try:
+        # One connection for schema setup and verification. setup() also
+        # switches the file to WAL (one fsync per checkpoint instead of two
+        # per commit; readers don't block the writer)
+        conn = sqlite3.connect(path, check_same_thread=False)
+        try:
+            SqliteSaver(conn).setup()
 
-        # Verify file exists
-        if not os.path.exists(path):
             if verbose:
-                print(f"[lgp] ✗ File not found: {path}")
-            return False
+                print(f"[lgp] ✓ Schema created")
 
-        if verbose:
-            file_size = os.path.getsize(path)
-            print(f"[lgp] ✓ File exists ({file_size} bytes)")
+            # Verify file exists
+            if not os.path.exists(path):
+                if verbose:
+                    print(f"[lgp] ✗ File not found: {path}")
+                return False
 
-        # Verify schema and WAL mode
-        conn = sqlite3.connect(path)
-        cursor = conn.cursor()
+            if verbose:
+                file_size = os.path.getsize(path)
+                print(f"[lgp] ✓ File exists ({file_size} bytes)")
 
-        # Check tables
-        tables = cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='table'"
-        ).fetchall()
-        table_names = [t[0] for t in tables]
+            # Tables and journal mode in a single statement
+            table_names, wal_mode = _schema_and_journal_mode(conn.cursor())
+        finally:
+            conn.close()
 
+        # Check tables
         if 'checkpoints' not in table_names:
             if verbose:
                 print(f"[lgp] ✗ checkpoints table missing")
-            conn.close()
             return False
 
         if 'writes' not in table_names:
             if verbose:
                 print(f"[lgp] ✗ writes table missing")
-            conn.close()
             return False
 
         if verbose:
             print(f"[lgp] ✓ Tables: {table_names}")
 
         # Check WAL mode
-        wal_mode = cursor.execute("PRAGMA journal_mode").fetchone()[0]
-
         if wal_mode != 'wal':
+            # Some filesystems (e.g. network mounts) refuse WAL. Checkpointing
+            # still works, just with rollback-journal locking.
+            logger.warning(f"[lgp] WAL mode not enabled for {path} (journal_mode: {wal_mode})")
             if verbose:
                 print(f"[lgp] ⚠ WAL mode not enabled (journal_mode: {wal_mode})")
-            # Don't fail - WAL mode is optional optimization
         elif verbose:
             print(f"[lgp] ✓ WAL mode enabled")
 
-        conn.close()
-
         if verbose:
             print(f"[lgp] ✅ Checkpointer setup complete")
 
@@ -250,15 +465,9 @@ def verify_checkpointer(path: str = "./checkpoints.sqlite") -> bool:
         return False
 
     try:
-        conn = sqlite3.connect(path)
-        cursor = conn.cursor()
-
-        # Check tables exist
-        tables = cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='table'"
-        ).fetchall()
-        table_names = [t[0] for t in tables]
-
+        # Read-only: a health check should never create or lock the file
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        table_names = _table_names(conn.cursor())
         conn.close()
 
         return 'checkpoints' in table_names and 'writes' in table_names
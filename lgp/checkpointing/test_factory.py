@@ -0,0 +1,183 @@
+"""
+Test suite for ResilientPostgresCheckpointer's retry and circuit breaker
+
+PostgreSQL and the SQLite fallback are stubbed: no database is needed.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from lgp.checkpointing import factory
+from lgp.checkpointing.factory import ResilientPostgresCheckpointer
+
+FALLBACK = object()
+
+
+class FakePool:
+    """Stands in for an opened AsyncConnectionPool"""
+
+    closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def breaker(monkeypatch):
+    """Fresh breaker state, a controllable clock and recorded retry sleeps"""
+    clock = SimpleNamespace(now=1000.0, sleeps=[])
+    monkeypatch.setattr(factory, "_PG_BREAKER", {"state": "closed", "opened_at": 0.0, "failure_count": 0})
+    monkeypatch.setattr(factory, "time", SimpleNamespace(monotonic=lambda: clock.now))
+
+    async def fake_sleep(delay):
+        clock.sleeps.append(delay)
+
+    monkeypatch.setattr(factory, "asyncio", SimpleNamespace(sleep=fake_sleep))
+
+    async def fake_fallback(self):
+        self.degraded = True
+        return FALLBACK
+
+    monkeypatch.setattr(ResilientPostgresCheckpointer, "_enter_fallback", fake_fallback)
+    return clock
+
+
+def _stub_pool(monkeypatch, outcome):
+    """Make _open_pool fail (outcome is an exception) or succeed; return call log"""
+    calls = []
+
+    async def open_pool(self):
+        calls.append(self)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return await outcome() if callable(outcome) else FakePool()
+
+    monkeypatch.setattr(ResilientPostgresCheckpointer, "_open_pool", open_pool)
+    return calls
+
+
+def _checkpointer(max_retries=3):
+    return ResilientPostgresCheckpointer("postgresql://stub", max_retries=max_retries, base_delay=1.0)
+
+
+class TestRetries:
+    """Test cases for the retry schedule"""
+
+    @pytest.mark.asyncio
+    async def test_jittered_exponential_delays(self, monkeypatch, breaker):
+        """Delays should double and stay within 0.5-1.5x of each step."""
+        _stub_pool(monkeypatch, OSError("refused"))
+
+        result = await _checkpointer(max_retries=3).__aenter__()
+
+        assert result is FALLBACK
+        assert len(breaker.sleeps) == 2
+        for delay, base in zip(breaker.sleeps, (1.0, 2.0)):
+            assert 0.5 * base <= delay <= 1.5 * base
+
+    @pytest.mark.asyncio
+    async def test_success_needs_no_fallback(self, monkeypatch):
+        """A reachable database should return the PostgreSQL saver."""
+        _stub_pool(monkeypatch, None)
+        cm = _checkpointer()
+
+        result = await cm.__aenter__()
+        await cm.__aexit__(None, None, None)
+
+        assert result is not FALLBACK
+        assert cm.degraded is False
+
+
+class TestCircuitBreaker:
+    """Test cases for the PostgreSQL circuit breaker"""
+
+    @pytest.mark.asyncio
+    async def test_opens_after_threshold(self, monkeypatch):
+        """Failed attempts should accumulate across instances until the threshold."""
+        calls = _stub_pool(monkeypatch, OSError("refused"))
+
+        await _checkpointer(max_retries=2).__aenter__()
+        assert factory._PG_BREAKER["state"] == "closed"
+        assert factory._PG_BREAKER["failure_count"] == 2
+
+        await _checkpointer(max_retries=2).__aenter__()
+        assert factory._PG_BREAKER["state"] == "open"
+        assert factory._PG_BREAKER["failure_count"] == 4
+        assert len(calls) == 4
+
+    @pytest.mark.asyncio
+    async def test_falls_back_during_cooldown(self, monkeypatch, breaker):
+        """While open, new instances should skip PostgreSQL entirely."""
+        calls = _stub_pool(monkeypatch, OSError("refused"))
+        await _checkpointer().__aenter__()
+        assert len(calls) == 3
+
+        breaker.now += factory._PG_BREAKER_COOLDOWN - 1
+        cm = _checkpointer()
+        assert await cm.__aenter__() is FALLBACK
+        assert cm.degraded is True
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_single_probe_after_cooldown(self, monkeypatch, breaker):
+        """After the cooldown, one caller probes once; the rest fall back."""
+        _stub_pool(monkeypatch, OSError("refused"))
+        await _checkpointer().__aenter__()
+        breaker.now += factory._PG_BREAKER_COOLDOWN
+
+        release = asyncio.Event()
+
+        async def slow_failure():
+            await release.wait()
+            raise OSError("still refused")
+
+        calls = _stub_pool(monkeypatch, slow_failure)
+        probe = asyncio.ensure_future(_checkpointer().__aenter__())
+        await asyncio.sleep(0)
+        assert factory._PG_BREAKER["state"] == "half_open"
+
+        # Another caller while the probe is in flight
+        assert await _checkpointer().__aenter__() is FALLBACK
+
+        release.set()
+        assert await probe is FALLBACK
+        assert len(calls) == 1  # one attempt, not the full retry schedule
+        assert factory._PG_BREAKER["state"] == "open"
+        assert factory._PG_BREAKER["opened_at"] == breaker.now
+
+    @pytest.mark.asyncio
+    async def test_closes_on_success(self, monkeypatch, breaker):
+        """A successful probe should close the breaker and reset the count."""
+        _stub_pool(monkeypatch, OSError("refused"))
+        await _checkpointer().__aenter__()
+        breaker.now += factory._PG_BREAKER_COOLDOWN
+
+        _stub_pool(monkeypatch, None)
+        cm = _checkpointer()
+        assert await cm.__aenter__() is not FALLBACK
+        await cm.__aexit__(None, None, None)
+
+        assert factory._PG_BREAKER["state"] == "closed"
+        assert factory._PG_BREAKER["failure_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_reopens(self, monkeypatch, breaker):
+        """A cancelled probe shouldn't leave the breaker stuck half-open."""
+        _stub_pool(monkeypatch, OSError("refused"))
+        await _checkpointer().__aenter__()
+        breaker.now += factory._PG_BREAKER_COOLDOWN
+
+        _stub_pool(monkeypatch, asyncio.CancelledError())
+        with pytest.raises(asyncio.CancelledError):
+            await _checkpointer().__aenter__()
+        assert factory._PG_BREAKER["state"] == "open"
+
+        # The next cooldown allows another probe
+        breaker.now += factory._PG_BREAKER_COOLDOWN
+        calls = _stub_pool(monkeypatch, None)
+        cm = _checkpointer()
+        assert await cm.__aenter__() is not FALLBACK
+        await cm.__aexit__(None, None, None)
+        assert len(calls) == 1
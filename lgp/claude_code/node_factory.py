@@ -7,8 +7,50 @@ Each node maintains session continuity via session_id in workflow state.
 Based on proven patterns from langfuse-langgraph-demo/claude_code_workflow.py
 """
 
-import re
-from typing import TypedDict, Dict, Any, Callable
+from typing import TypedDict, Dict, Any, Callable, Optional, Tuple
+
+# mesh-mcp result text: "Session ID: <uuid>\n\n<content>[\n\n--- Execution Metadata ---...]"
+_SESSION_PREFIX = "Session ID: "
+_SESSION_ID_CHARS = "0123456789abcdef-"
+_METADATA_MARKER = "\n\n--- Execution Metadata ---"
+
+# Guard for sanitize_for_dashboard (matches the default recursion limit)
+_MAX_SANITIZE_DEPTH = 1000
+
+
+def _parse_mesh_result(text: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Extract (session_id, output) from mesh-mcp result text.
+
+    Fixed-literal scanning (str.find / lstrip) rather than regex: the
+    session ID is the run of lowercase hex and dashes after the prefix,
+    and the output is everything after the following blank line, up to the
+    metadata section.
+
+    Args:
+        text: Text content returned by mesh_execute
+
+    Returns:
+        (session_id, output); either is None when not present
+    """
+    start = text.find(_SESSION_PREFIX)
+    if start < 0:
+        return None, None
+    start += len(_SESSION_PREFIX)
+
+    line_end = text.find("\n", start)
+    line = text[start:] if line_end < 0 else text[start:line_end]
+    session_id = line[:len(line) - len(line.lstrip(_SESSION_ID_CHARS))]
+    if not session_id:
+        return None, None
+
+    # Output needs "\n\n" right after the ID and at least one character
+    body = start + len(session_id) + 2
+    if not text.startswith("\n\n", body - 2) or body >= len(text):
+        return session_id, None
+
+    end = text.find(_METADATA_MARKER, body + 1)
+    return session_id, text[body:end if end >= 0 else len(text)].strip()
 
 
 class AgentRoleConfig(TypedDict):
@@ -29,7 +71,7 @@ def create_claude_code_node(config: AgentRoleConfig, mcp_manager) -> Callable:
 
     Args:
         config: Agent role configuration
-        mcp_manager: MCPSessionManager instance (creates sessions per invocation)
+        mcp_manager: MCPSessionManager instance (its shared session is used)
 
     Returns:
         Async node function compatible with LangGraph
@@ -44,12 +86,15 @@ def create_claude_code_node(config: AgentRoleConfig, mcp_manager) -> Callable:
         >>> researcher_node = create_claude_code_node(researcher_config, mcp_manager)
         >>> result = await researcher_node({'task': 'Research topic X'})
     """
+    # State keys for this role, built once rather than per execution
+    task_key = f'{config["role_name"]}_task'
+    session_key = f"{config['role_name']}_session_id"
+    output_key = f'{config["role_name"]}_output'
 
     async def agent_node(state: Dict[str, Any]) -> Dict[str, Any]:
         """Node function that invokes Claude Code via mesh_execute"""
 
         # Extract task from state
-        task_key = f'{config["role_name"]}_task'
         task = state.get('task') or state.get(task_key)
 
         if not task:
@@ -59,7 +104,6 @@ def create_claude_code_node(config: AgentRoleConfig, mcp_manager) -> Callable:
             )
 
         # Get session_id for continuity (stored by R4 checkpointer)
-        session_key = f"{config['role_name']}_session_id"
         session_id = state.get(session_key)
 
         # Prepare mesh_execute arguments
@@ -73,9 +117,9 @@ def create_claude_code_node(config: AgentRoleConfig, mcp_manager) -> Callable:
         if session_id:
             invoke_args['session_id'] = session_id
 
-        # Create MCP session for this invocation
-        # Each node execution creates a fresh session to mesh-mcp server
-        async with mcp_manager.create_session() as mcp_session:
+        # Borrow the manager's long-lived session to mesh-mcp server
+        # (started on first use, so only the first call pays docker exec)
+        async with mcp_manager.shared_session() as mcp_session:
             # Invoke Claude Code session via mesh-mcp
             # Path: mcp_session.call_tool() → mesh-mcp server
             #       → DockerClaudeService → claude CLI in container
@@ -93,24 +137,20 @@ def create_claude_code_node(config: AgentRoleConfig, mcp_manager) -> Callable:
                     if hasattr(item, 'text'):
                         text = item.text
 
-                        # Parse session ID from "Session ID: <uuid>"
-                        session_match = re.search(r'Session ID: ([a-f0-9-]+)', text)
-                        if session_match:
-                            returned_session_id = session_match.group(1)
-
-                        # Parse output - comes after "Session ID: <uuid>\n\n<content>"
-                        # Stop at metadata section if present
-                        output_match = re.search(
-                            r'Session ID: [a-f0-9-]+\n\n(.+?)(?:\n\n--- Execution Metadata ---|$)',
-                            text,
-                            re.DOTALL
-                        )
-                        if output_match:
-                            output = output_match.group(1).strip()
+                        # Parse "Session ID: <uuid>\n\n<content>" - output stops at
+                        # the metadata section if present
+                        session_id_found, output_found = _parse_mesh_result(text)
+                        if session_id_found:
+                            returned_session_id = session_id_found
+                        if output_found is not None:
+                            output = output_found
+
+                        if returned_session_id and output is not None:
+                            break  # Both found; skip remaining items
 
             # Return updated state with output and session_id
             result_state = {
-                f'{config["role_name"]}_output': output,
+                output_key: output,
                 session_key: returned_session_id,
                 'current_step': [config['role_name']]  # Topic channel (accumulates in parallel)
             }
@@ -125,6 +165,22 @@ def create_claude_code_node(config: AgentRoleConfig, mcp_manager) -> Callable:
     return agent_node
 
 
+def _has_long_strings(data: Dict[str, Any], limit: int) -> bool:
+    """True if any string value in data or its nested dicts is longer than limit"""
+    stack = [(data, 0)]
+    while stack:
+        current, depth = stack.pop()
+        if depth > _MAX_SANITIZE_DEPTH:
+            raise RecursionError("sanitize_for_dashboard: data nested too deeply")
+        for value in current.values():
+            if isinstance(value, str):
+                if len(value) > limit:
+                    return True
+            elif isinstance(value, dict):
+                stack.append((value, depth + 1))
+    return False
+
+
 def sanitize_for_dashboard(data: Dict[str, Any], max_string_length: int = 2000) -> Dict[str, Any]:
     """
     Sanitize trace data to prevent Langfuse dashboard errors.
@@ -134,28 +190,53 @@ def sanitize_for_dashboard(data: Dict[str, Any], max_string_length: int = 2000)
     - React component errors
     - Failed API calls
 
-    This truncates large strings while preserving metadata.
+    This truncates large strings while preserving metadata. Nested dicts are
+    walked with an explicit stack rather than recursion.
 
     Args:
         data: Dictionary to sanitize
         max_string_length: Maximum string length before truncation
 
     Returns:
-        Sanitized dictionary with truncated strings
+        Sanitized dictionary with truncated strings (data itself, uncopied,
+        when nothing needs truncating)
+
+    Raises:
+        RecursionError: If dicts are nested deeper than _MAX_SANITIZE_DEPTH
+            (e.g. a dict that contains itself)
     """
     if not isinstance(data, dict):
         return data
 
-    result = {}
-    for key, value in data.items():
-        if isinstance(value, str) and len(value) > max_string_length:
-            # Truncate long strings
-            result[key] = value[:max_string_length] + f"... (truncated, full length: {len(value)} chars)"
-            result[f"{key}_full_length"] = len(value)
-        elif isinstance(value, dict):
-            # Recursively sanitize nested dicts
-            result[key] = sanitize_for_dashboard(value, max_string_length)
-        else:
-            result[key] = value
+    # Common case: nothing to truncate, so skip rebuilding every level
+    if not _has_long_strings(data, max_string_length):
+        return data
+
+    result: Dict[str, Any] = {}
+    # (source dict, output dict, depth). Output dicts for nested values are
+    # placed in their parent immediately and filled when popped, so key
+    # order matches the input.
+    stack = [(data, result, 0)]
+
+    while stack:
+        source, target, depth = stack.pop()
+        if depth > _MAX_SANITIZE_DEPTH:
+            raise RecursionError("sanitize_for_dashboard: data nested too deeply")
+
+        for key, value in source.items():
+            if isinstance(value, str):
+                if len(value) > max_string_length:
+                    # Truncate long strings
+                    target[key] = value[:max_string_length] + f"... (truncated, full length: {len(value)} chars)"
+                    target[f"{key}_full_length"] = len(value)
+                else:
+                    target[key] = value
+            elif isinstance(value, dict):
+                # Sanitize nested dicts
+                nested: Dict[str, Any] = {}
+                target[key] = nested
+                stack.append((value, nested, depth + 1))
+            else:
+                target[key] = value
 
     return result
@@ -5,23 +5,70 @@ Manages MCP client session lifecycle for Claude Code nodes.
 Based on mesh-mcp architecture with claude-mcp Docker container.
 """
 
-from typing import Optional
-from contextlib import asynccontextmanager
+import asyncio
+import os
+import weakref
+import anyio
+from typing import Dict, Optional
+from contextlib import asynccontextmanager, nullcontext
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+# Default cap on concurrent sessions (each one is a docker exec process
+# plus a Claude Code CLI in the container)
+DEFAULT_MAX_CONCURRENCY = min(os.cpu_count() or 4, 8)
+
+# Session limits, per event loop (asyncio primitives are loop-bound) and
+# per container. Shared by every manager targeting the same container.
+_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _container_semaphore(container_name: str, limit: int) -> asyncio.Semaphore:
+    """Return the running loop's semaphore for container_name, creating it with limit"""
+    per_container = _SEMAPHORES.setdefault(asyncio.get_running_loop(), {})
+    semaphore = per_container.get(container_name)
+    if semaphore is None:
+        semaphore = per_container[container_name] = asyncio.Semaphore(limit)
+    return semaphore
+
+
+async def _forward(source, sink) -> None:
+    """Relay messages from source to sink, closing sink when source ends"""
+    async with sink:
+        try:
+            async for message in source:
+                await sink.send(message)
+        except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+            pass  # Session side closed first
+
 
 class MCPSessionManager:
     """Manages MCP client session for Claude Code interactions"""
 
-    def __init__(self, container_name: str = "claude-mcp"):
+    def __init__(self, container_name: str = "claude-mcp", max_concurrency: Optional[int] = None):
         """
         Initialize MCP session manager.
 
         Args:
             container_name: Docker container name running mesh-mcp server
+            max_concurrency: Maximum sessions open at once against this
+                container, across all managers (default:
+                DEFAULT_MAX_CONCURRENCY; 0 disables the limit). The first
+                manager to open a session on a loop sets the limit.
         """
         self.container_name = container_name
+        self.max_concurrency = DEFAULT_MAX_CONCURRENCY if max_concurrency is None else max_concurrency
+
+        # Long-lived session shared by shared_session() callers. It lives in
+        # a background task (anyio requires the stdio transport to be
+        # entered and exited by the same task) on the loop that opened it.
+        self._shared_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._shared_lock: Optional[asyncio.Lock] = None
+        self._shared_ready: Optional[asyncio.Future] = None
+        self._shared_stop: Optional[asyncio.Event] = None
+        self._shared_task: Optional[asyncio.Task] = None
         self.server_params = StdioServerParameters(
             command="docker",
             args=[
@@ -33,6 +80,102 @@ class MCPSessionManager:
             ]
         )
 
+    def _limiter(self):
+        """Per-container concurrency slot (no-op when max_concurrency is 0)"""
+        if self.max_concurrency:
+            return _container_semaphore(self.container_name, self.max_concurrency)
+        return nullcontext()
+
+    async def _run_shared_session(self, ready: asyncio.Future, stop: asyncio.Event) -> None:
+        """
+        Open one session, publish it through ready, and hold it until stop is
+        set or the server exits.
+
+        The server's messages are relayed to the session through a stream
+        owned here, so the end of the server's output (process exited) ends
+        this task too and the next caller starts a fresh session.
+        """
+        try:
+            async with stdio_client(self.server_params) as (read, write):
+                relay_send, relay_receive = anyio.create_memory_object_stream(0)
+                relay = asyncio.ensure_future(_forward(read, relay_send))
+                try:
+                    async with ClientSession(relay_receive, write) as session:
+                        await session.initialize()
+                        ready.set_result(session)
+                        stopping = asyncio.ensure_future(stop.wait())
+                        try:
+                            await asyncio.wait({stopping, relay}, return_when=asyncio.FIRST_COMPLETED)
+                        finally:
+                            stopping.cancel()
+                finally:
+                    relay.cancel()
+        except asyncio.CancelledError:
+            if not ready.done():
+                ready.cancel()
+            raise
+        except Exception as e:
+            if ready.done():
+                raise
+            # Failed to start: the error reaches callers through ready, and
+            # re-raising here would only log "Task exception was never retrieved"
+            ready.set_exception(e)
+
+    async def get_or_create_shared_session(self) -> ClientSession:
+        """
+        Return this manager's long-lived MCP session, starting it on first use.
+
+        Reuses one docker exec / stdio transport for every call instead of
+        spawning a process per node execution. A session that has died (or
+        belongs to a previous event loop) is replaced.
+
+        Returns:
+            ClientSession: Initialized MCP session shared by all callers
+        """
+        loop = asyncio.get_running_loop()
+        if self._shared_loop is not loop:
+            # asyncio primitives and the transport are bound to one loop
+            self._shared_loop = loop
+            self._shared_lock = asyncio.Lock()
+            self._shared_task = None
+
+        async with self._shared_lock:
+            if self._shared_task is None or self._shared_task.done():
+                self._shared_ready = loop.create_future()
+                self._shared_stop = asyncio.Event()
+                self._shared_task = loop.create_task(
+                    self._run_shared_session(self._shared_ready, self._shared_stop)
+                )
+            ready = self._shared_ready
+
+        return await asyncio.shield(ready)
+
+    @asynccontextmanager
+    async def shared_session(self):
+        """
+        Borrow the shared session, holding a concurrency slot while in use.
+
+        Yields:
+            ClientSession: The long-lived session from get_or_create_shared_session()
+
+        Example:
+            >>> async with manager.shared_session() as session:
+            >>>     result = await session.call_tool('mesh_execute', {...})
+        """
+        async with self._limiter():
+            yield await self.get_or_create_shared_session()
+
+    async def aclose(self) -> None:
+        """Close the shared session (if open) and wait for its transport to exit."""
+        task, self._shared_task = self._shared_task, None
+        if task is None or task.done() or self._shared_loop is not asyncio.get_running_loop():
+            return
+        self._shared_stop.set()
+        try:
+            await task
+        except Exception:
+            pass  # Ignore transport errors on shutdown
+
     @asynccontextmanager
     async def create_session(self):
         """
@@ -46,20 +189,31 @@ class MCPSessionManager:
             >>> async with manager.create_session() as session:
             >>>     result = await session.call_tool('mesh_execute', {...})
         """
-        async with stdio_client(self.server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                # Initialize session
-                await session.initialize()
+        # Wait for a free slot before spawning another docker exec
+        async with self._limiter():
+            async with stdio_client(self.server_params) as (read, write):
+                async with ClientSession(read, write) as session:
+                    # Initialize session
+                    await session.initialize()
+
+                    # Yield session for use
+                    yield session
 
-                # Yield session for use
-                yield session
+
+_default_manager: Optional[MCPSessionManager] = None
 
 
 def get_default_manager() -> MCPSessionManager:
     """
     Get default MCP session manager instance.
 
+    The instance is created once per process, so every Claude Code node
+    built with it shares one MCP session.
+
     Returns:
         MCPSessionManager configured for claude-mcp container
     """
-    return MCPSessionManager(container_name="claude-mcp")
+    global _default_manager
+    if _default_manager is None:
+        _default_manager = MCPSessionManager(container_name="claude-mcp")
+    return _default_manager
@@ -0,0 +1,52 @@
+"""
+Test suite for node_factory's mesh-mcp result parsing
+
+_parse_mesh_result must agree with the regexes it replaced.
+"""
+
+import re
+
+import pytest
+
+from lgp.claude_code.node_factory import _parse_mesh_result
+
+
+def _regex_parse(text):
+    """The original regex-based parsing, kept as the reference behaviour"""
+    session_match = re.search(r'Session ID: ([a-f0-9-]+)', text)
+    output_match = re.search(
+        r'Session ID: [a-f0-9-]+\n\n(.+?)(?:\n\n--- Execution Metadata ---|$)',
+        text,
+        re.DOTALL
+    )
+    return (
+        session_match.group(1) if session_match else None,
+        output_match.group(1).strip() if output_match else None,
+    )
+
+
+SESSION = "3f2a9c1e-0b7d-4e58-9a61-2c4d8e7f1b30"
+
+CASES = {
+    "with metadata": f"Session ID: {SESSION}\n\nDone the task.\nSecond line.\n\n--- Execution Metadata ---\nDuration: 12s",
+    "without metadata": f"Session ID: {SESSION}\n\nDone the task.\n",
+    "empty body": f"Session ID: {SESSION}\n\n",
+    "single character body": f"Session ID: {SESSION}\n\nx",
+    "missing blank line": f"Session ID: {SESSION}\nDone the task.",
+    "no session": "Error: container not running",
+    "session id at end": f"Session ID: {SESSION}",
+    "prefix without id": "Session ID: \n\nDone the task.",
+    "id stops at non-hex": f"Session ID: {SESSION}XYZ\n\nDone.",
+    "text before prefix": f"Resumed.\nSession ID: {SESSION}\n\n  padded output  \n\n--- Execution Metadata ---",
+}
+
+
+@pytest.mark.parametrize("text", CASES.values(), ids=CASES.keys())
+def test_matches_regex(text):
+    """Should return the same (session_id, output) as the original regexes."""
+    assert _parse_mesh_result(text) == _regex_parse(text)
+
+
+def test_with_metadata_values():
+    """Should strip the output and stop at the metadata section."""
+    assert _parse_mesh_result(CASES["with metadata"]) == (SESSION, "Done the task.\nSecond line.")
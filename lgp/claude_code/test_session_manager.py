@@ -0,0 +1,100 @@
+"""
+Test suite for MCPSessionManager's shared session
+
+Runs against a stub MCP server over stdio (no Docker needed).
+"""
+
+import asyncio
+import sys
+import textwrap
+
+import pytest
+from mcp import StdioServerParameters
+
+from lgp.claude_code.session_manager import MCPSessionManager
+
+
+STUB_SERVER = textwrap.dedent('''
+    import os
+    try:
+        from mcp.server.fastmcp import FastMCP
+    except ImportError:  # mcp >= 2 renamed it
+        from mcp.server.mcpserver import MCPServer as FastMCP
+
+    server = FastMCP("stub-mesh")
+
+    @server.tool()
+    def echo(text: str) -> str:
+        return f"{os.getpid()}:{text}"
+
+    @server.tool()
+    def crash() -> str:
+        os._exit(1)
+
+    server.run()
+''')
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Manager whose sessions talk to the stub server"""
+    script = tmp_path / "stub_mesh.py"
+    script.write_text(STUB_SERVER)
+    manager = MCPSessionManager(container_name="stub", max_concurrency=0)
+    manager.server_params = StdioServerParameters(command=sys.executable, args=[str(script)])
+    return manager
+
+
+async def _call(manager, tool, **arguments):
+    async with manager.shared_session() as session:
+        result = await session.call_tool(tool, arguments=arguments)
+    return result.content[0].text
+
+
+async def _wait_for_shared_task(manager, timeout=5.0):
+    """Wait until the background session task has finished"""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not manager._shared_task.done():
+        assert asyncio.get_running_loop().time() < deadline, "shared session task still running"
+        await asyncio.sleep(0.05)
+
+
+class TestSharedSession:
+    """Test cases for shared_session()"""
+
+    @pytest.mark.asyncio
+    async def test_reuses_one_server(self, manager):
+        """Calls should share one server process."""
+        try:
+            first = await _call(manager, "echo", text="a")
+            second = await _call(manager, "echo", text="b")
+        finally:
+            await manager.aclose()
+
+        assert first.endswith(":a") and second.endswith(":b")
+        assert first.split(":")[0] == second.split(":")[0]
+
+    @pytest.mark.asyncio
+    async def test_replaces_dead_session(self, manager):
+        """A session whose server exited should be replaced on next use."""
+        try:
+            before = await _call(manager, "echo", text="a")
+
+            with pytest.raises(Exception):
+                await _call(manager, "crash")
+            await _wait_for_shared_task(manager)
+
+            after = await _call(manager, "echo", text="b")
+        finally:
+            await manager.aclose()
+
+        assert after.endswith(":b")
+        assert before.split(":")[0] != after.split(":")[0]
+
+    @pytest.mark.asyncio
+    async def test_failed_start_reaches_caller(self, manager):
+        """A server that can't start should fail the caller, not hang."""
+        manager.server_params = StdioServerParameters(command="/nonexistent/lgp-stub")
+        with pytest.raises(Exception):
+            await _call(manager, "echo", text="a")
+        await manager.aclose()
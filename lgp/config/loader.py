@@ -10,13 +10,50 @@ Loads environment-specific configuration from YAML files with:
 import os
 import re
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
 
+# libyaml-backed safe loader when available (parsed in C)
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 # Load .env file
 load_dotenv()
 
+# ${VAR_NAME} or ${VAR_NAME:default}
+_ENV_PATTERN = re.compile(r'\$\{([^}:]+)(?::([^}]*))?\}')
+
+
+def _env_replacer(match: "re.Match[str]", _getenv=os.environ.get) -> str:
+    """Replacement for one _ENV_PATTERN match"""
+    value = _getenv(match.group(1))
+
+    if value is None:
+        default_value = match.group(2)
+        if default_value is not None:
+            return default_value
+        # Keep original ${VAR} if not set and no default
+        return match.group(0)
+
+    return value
+
+
+@lru_cache(maxsize=16)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a YAML file, cached per (path, mtime, size).
+
+    Editing the file changes its mtime/size and therefore the cache key.
+    Callers must not mutate the result; ConfigLoader.load() builds a fresh
+    tree from it during env var substitution.
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
 
 class ConfigLoader:
     """Loads and validates configuration from YAML files"""
@@ -58,17 +95,20 @@ class ConfigLoader:
 
         config_file = self.config_dir / f"{environment}.yaml"
 
-        if not config_file.exists():
+        try:
+            stat = config_file.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Config file not found: {config_file}\n"
                 f"Expected: config/{environment}.yaml"
-            )
+            ) from None
 
-        # Load YAML
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
+        # Load YAML (parsed once per file version)
+        config = _parse_yaml(str(config_file), stat.st_mtime_ns, stat.st_size)
 
-        # Substitute environment variables
+        # Substitute environment variables. This runs on every load (env
+        # may change) and returns new dicts/lists, so the cached parse is
+        # never exposed to callers.
         config = self._substitute_env_vars(config)
 
         # Validate config
@@ -96,24 +136,10 @@ class ConfigLoader:
         elif isinstance(config, list):
             return [self._substitute_env_vars(item) for item in config]
         elif isinstance(config, str):
-            # Match ${VAR_NAME} or ${VAR_NAME:default}
-            pattern = r'\$\{([^}:]+)(?::([^}]*))?\}'
-
-            def replacer(match):
-                var_name = match.group(1)
-                default_value = match.group(2)
-                value = os.getenv(var_name)
-
-                if value is None:
-                    if default_value is not None:
-                        return default_value
-                    else:
-                        # Keep original ${VAR} if not set and no default
-                        return match.group(0)
-
-                return value
-
-            return re.sub(pattern, replacer, config)
+            # Most values contain no placeholder; skip the regex for those
+            if "${" not in config:
+                return config
+            return _ENV_PATTERN.sub(_env_replacer, config)
         else:
             return config
 
@@ -1,11 +1,12 @@
 """Observability module for LangGraph Platform."""
 
-from .tracers import get_tracer, flush_traces, configure_langfuse
+from .tracers import get_tracer, flush_traces, configure_langfuse, observe
 from .sanitizers import sanitize_for_dashboard
 
 __all__ = [
     "get_tracer",
     "flush_traces",
     "configure_langfuse",
+    "observe",
     "sanitize_for_dashboard",
 ]
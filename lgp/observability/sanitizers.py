@@ -17,7 +17,8 @@ def sanitize_for_dashboard(
     Sanitize data for Langfuse dashboard display.
 
     Truncates string values >max_length while preserving metadata about
-    the original length. Returns both sanitized data and metadata.
+    the original length. Returns both sanitized data and metadata. A dict
+    or list with nothing to truncate is returned as-is (not copied).
 
     Args:
         data: Data to sanitize (dict, str, list, or primitive)
@@ -48,6 +49,10 @@ def sanitize_for_dashboard(
         return data, metadata
 
     elif isinstance(data, dict):
+        # Common case: nothing to truncate, return the dict as-is
+        if not any(isinstance(value, str) and len(value) > max_length for value in data.values()):
+            return data, metadata
+
         sanitized_dict = {}
         for key, value in data.items():
             if isinstance(value, str) and len(value) > max_length:
@@ -59,6 +64,9 @@ def sanitize_for_dashboard(
         return sanitized_dict, metadata
 
     elif isinstance(data, list):
+        if not any(isinstance(item, str) and len(item) > max_length for item in data):
+            return data, metadata
+
         # Truncate individual list items
         sanitized_list = []
         for i, item in enumerate(data):
@@ -6,7 +6,7 @@ and metadata injection for all workflow executions.
 """
 
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Optional
 from dotenv import load_dotenv
 from langfuse import Langfuse
 
@@ -168,3 +168,27 @@ def flush_traces():
 def is_tracing_enabled() -> bool:
     """Check if Langfuse tracing is enabled."""
     return LangfuseTracer.is_enabled()
+
+
+def _resolve_observe() -> Callable:
+    """
+    Pick the @observe decorator once, at import.
+
+    Without Langfuse credentials every span would be dropped anyway, so the
+    no-op variant returns the decorated function itself and adds no wrapper
+    frame to each call.
+    """
+    if os.getenv("LANGFUSE_PUBLIC_KEY") and os.getenv("LANGFUSE_SECRET_KEY"):
+        from langfuse import observe as langfuse_observe
+        return langfuse_observe
+
+    def identity_observe(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]  # bare @observe
+        return lambda fn: fn  # @observe(name=...)
+
+    return identity_observe
+
+
+# Langfuse's observe when credentials are configured, else an identity decorator
+observe = _resolve_observe()
@@ -7,8 +7,9 @@ Executes workflows with environment-specific configuration (experiment vs hosted
 import importlib.util
 import asyncio
 import time
+import weakref
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import sys
 from langfuse import observe, propagate_attributes
 from lgp.observability import (
@@ -27,11 +28,37 @@ from lgp.agents.factory import create_agent_node
 class WorkflowExecutor:
     """Executes workflows with environment-specific configuration"""
 
-    def __init__(self, environment: str = "experiment", verbose: bool = False):
+    def __init__(
+        self,
+        environment: str = "experiment",
+        verbose: bool = False,
+        reuse_checkpointer: bool = False
+    ):
+        """
+        Args:
+            environment: Environment name (experiment/hosted)
+            verbose: Print progress details
+            reuse_checkpointer: Keep one opened checkpointer per event loop
+                and share it across runs instead of opening a connection per
+                run. The owner must call aclose() before the loop ends.
+        """
         self.environment = environment
         self.verbose = verbose
+        self.reuse_checkpointer = reuse_checkpointer
         self.config = self._load_config(environment)
 
+        # Shared checkpointers (reuse_checkpointer=True): event loop -> task
+        # resolving to (context manager, checkpointer). Connections are bound
+        # to the loop that opened them, hence one entry per loop.
+        self._checkpointers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Task]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+        # Loaded workflows with agent nodes injected, keyed by resolved path:
+        # path -> (file mtime_ns, module, workflow). Re-used until the file
+        # changes so hosted requests don't re-exec the module every time.
+        self._workflow_cache: Dict[str, Tuple[int, Any, Any]] = {}
+
         # Configure Langfuse if enabled
         if self.config.get("observability", {}).get("langfuse", False):
             configure_langfuse(enabled=True)
@@ -240,6 +267,128 @@ class WorkflowExecutor:
 
         return workflow
 
+    async def _get_workflow(self, workflow_path: str) -> Tuple[Any, Any]:
+        """
+        Load, extract and inject agents into a workflow, cached per file.
+
+        The cached entry is invalidated when the file's mtime changes, so
+        hot reload still picks up edits.
+
+        Args:
+            workflow_path: Path to workflow file
+
+        Returns:
+            (module, workflow) where workflow is the builder or compiled graph
+        """
+        path = Path(workflow_path).resolve()
+        if not path.exists():
+            raise FileNotFoundError(f"Workflow not found: {workflow_path}")
+
+        key = str(path)
+        mtime_ns = path.stat().st_mtime_ns
+        cached = self._workflow_cache.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            if self.verbose:
+                print(f"[lgp] Workflow loaded from cache")
+            return cached[1], cached[2]
+
+        # Load workflow module
+        module = self._load_workflow_module(workflow_path)
+
+        if self.verbose:
+            print(f"[lgp] Module loaded: {module.__name__}")
+
+        # Extract workflow (builder or compiled graph)
+        workflow = self._extract_workflow(module)
+
+        if self.verbose:
+            print(f"[lgp] Workflow extracted")
+
+        # Inject Claude Code nodes if configured
+        workflow = await self._inject_claude_code_nodes(workflow, module)
+
+        self._workflow_cache[key] = (mtime_ns, module, workflow)
+        return module, workflow
+
+    async def _open_checkpointer(self) -> Optional[Tuple[Any, Any]]:
+        """
+        Enter a checkpointer context manager built from config.
+
+        Returns:
+            (context manager, checkpointer), or None if PostgreSQL was
+            unreachable and the node-local SQLite fallback was opened instead
+            (it is closed again rather than shared)
+        """
+        checkpointer_cm = create_checkpointer(self.config["checkpointer"])
+        checkpointer = await checkpointer_cm.__aenter__()
+        if getattr(checkpointer_cm, "degraded", False):
+            await checkpointer_cm.__aexit__(None, None, None)
+            return None
+        return checkpointer_cm, checkpointer
+
+    async def _get_checkpointer(self) -> Optional[Any]:
+        """
+        Return the shared checkpointer for the running loop, opening it once.
+
+        Concurrent first callers await the same opening task, so only one
+        connection is created. Neither a failed open nor a degraded fallback
+        is cached, so the next run tries PostgreSQL again (gated by the
+        checkpointing circuit breaker).
+
+        Returns:
+            Shared checkpointer, or None if only the fallback was available
+            (the caller opens its own per-run checkpointer)
+        """
+        loop = asyncio.get_running_loop()
+        task = self._checkpointers.get(loop)
+        if task is None:
+            task = loop.create_task(self._open_checkpointer())
+            self._checkpointers[loop] = task
+
+        try:
+            opened = await asyncio.shield(task)
+        except Exception:
+            # Don't cache a failed open; the next run retries
+            if self._checkpointers.get(loop) is task:
+                del self._checkpointers[loop]
+            raise
+
+        if opened is None:
+            # Degraded: don't pin the server to node-local state
+            if self._checkpointers.get(loop) is task:
+                del self._checkpointers[loop]
+            return None
+        return opened[1]
+
+    async def aclose(self) -> None:
+        """
+        Close resources opened on the running loop: the shared checkpointer
+        (if any) and the default MCP manager's shared session used by
+        Claude Code nodes
+        """
+        from lgp.claude_code.session_manager import get_default_manager
+
+        try:
+            task = self._checkpointers.pop(asyncio.get_running_loop(), None)
+            if task is None:
+                return
+            try:
+                opened = await task
+            except Exception:
+                return  # Never opened
+            if opened is not None:
+                checkpointer_cm, _ = opened
+                await checkpointer_cm.__aexit__(None, None, None)
+        finally:
+            await get_default_manager().aclose()
+
+    async def _aexecute_and_close(self, workflow_path: str, input_data: Dict[str, Any]):
+        """aexecute() on a loop created for this run, closing its resources before the loop ends"""
+        try:
+            return await self.aexecute(workflow_path, input_data)
+        finally:
+            await self.aclose()
+
     def execute(self, workflow_path: str, input_data: Optional[Dict[str, Any]] = None):
         """Execute workflow (synchronous entry point)"""
         if input_data is None:
@@ -247,7 +396,8 @@ class WorkflowExecutor:
 
         # Check if workflow is async
         try:
-            return asyncio.run(self.aexecute(workflow_path, input_data))
+            # The loop only lives for this run, so close what it opened
+            return asyncio.run(self._aexecute_and_close(workflow_path, input_data))
         except RuntimeError as e:
             if "asyncio.run() cannot be called from a running event loop" in str(e):
                 # Already in async context
@@ -267,27 +417,19 @@ class WorkflowExecutor:
         checkpointer_cm = None
 
         try:
-            # Load workflow module
-            module = self._load_workflow_module(workflow_path)
-
-            if self.verbose:
-                print(f"[lgp] Module loaded: {module.__name__}")
-
-            # Extract workflow (builder or compiled graph)
-            workflow = self._extract_workflow(module)
-
-            if self.verbose:
-                print(f"[lgp] Workflow extracted")
-
-            # Inject Claude Code nodes if configured
-            workflow = await self._inject_claude_code_nodes(workflow, module)
+            # Load workflow (module exec + agent injection happen once per
+            # file version)
+            module, workflow = await self._get_workflow(workflow_path)
 
             # Inject checkpointer based on config
             if self.config.get("checkpointer"):
-                checkpointer_cm = create_checkpointer(self.config["checkpointer"])
+                checkpointer = await self._get_checkpointer() if self.reuse_checkpointer else None
+                if checkpointer is None:
+                    # Per-run checkpointer (closed in finally)
+                    checkpointer_cm = create_checkpointer(self.config["checkpointer"])
 
-                # Enter async context manager to get actual checkpointer
-                checkpointer = await checkpointer_cm.__aenter__()
+                    # Enter async context manager to get actual checkpointer
+                    checkpointer = await checkpointer_cm.__aenter__()
 
                 # If workflow is a builder (has compile method), compile with checkpointer
                 if hasattr(workflow, 'compile'):
@@ -310,6 +452,12 @@ class WorkflowExecutor:
             if self.verbose:
                 print(f"[lgp] Using thread_id: {thread_id}")
 
+            # Checkpoint durability: "exit" buffers every step's writes and
+            # persists them once when the run finishes (one transaction
+            # instead of one per step). Unset keeps LangGraph's default.
+            durability = self.config.get("checkpointer", {}).get("durability")
+            invoke_kwargs = {"durability": durability} if durability else {}
+
             # Prepare metadata and tags for Langfuse
             metadata = LangfuseTracer.get_metadata(
                 workflow_name=workflow_name,
@@ -332,11 +480,16 @@ class WorkflowExecutor:
                         workflow,
                         input_data,
                         workflow_name,
-                        execution_config
+                        execution_config,
+                        **invoke_kwargs
                     )
             else:
                 # Execute without tracing
-                result = await workflow.ainvoke(input_data, config=execution_config)
+                result = await workflow.ainvoke(
+                    input_data,
+                    config=execution_config,
+                    **invoke_kwargs
+                )
 
             elapsed = time.time() - start_time
 
@@ -391,7 +544,8 @@ class WorkflowExecutor:
         workflow,
         input_data: Dict[str, Any],
         workflow_name: str,
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        **invoke_kwargs
     ):
         """
         Execute workflow with Langfuse trace decoration.
@@ -404,4 +558,4 @@ class WorkflowExecutor:
             async def my_node(state):
                 ...
         """
-        return await workflow.ainvoke(input_data, config=config)
+        return await workflow.ainvoke(input_data, config=config, **invoke_kwargs)
@@ -4,25 +4,39 @@ API Server - Hosts workflows via HTTP in hosted mode
 Uses FastAPI + Uvicorn for serving workflows.
 """
 
+import os
 import uvicorn
 from pathlib import Path
 
 
-def serve_workflow(workflow_path: str, host: str = "0.0.0.0", port: int = 8000):
+def serve_workflow(
+    workflow_path: str,
+    host: str = "0.0.0.0",
+    port: int = 8000,
+    workers: int = 1
+):
     """Start FastAPI server for workflow
 
+    Uses uvloop and httptools when they are installed (uvicorn[standard]),
+    falling back to the asyncio loop and h11 parser otherwise.
+
     Args:
         workflow_path: Path to workflow file
         host: Host to bind to
         port: Port to run on
+        workers: Number of worker processes
     """
     from api.app import app
 
-    # Store workflow path in app state
+    # Store workflow path in app state. Worker processes re-import the app,
+    # so the lifespan also picks these up from the environment.
     app.state.workflow_path = str(Path(workflow_path).resolve())
     app.state.workflow_name = Path(workflow_path).stem
+    os.environ["LGP_WORKFLOW_PATH"] = app.state.workflow_path
 
     print(f"[lgp] Workflow loaded: {app.state.workflow_name}")
+    if workers > 1:
+        print(f"[lgp] Workers: {workers}")
     print(f"[lgp] ✅ Server ready")
     print()
     print(f"API Endpoints:")
@@ -31,10 +45,23 @@ def serve_workflow(workflow_path: str, host: str = "0.0.0.0", port: int = 8000):
     print(f"  GET  {host}:{port}/sessions/{{thread_id}}")
     print()
 
-    # Run server
+    # Run server (multiple workers require an import string)
     uvicorn.run(
-        app,
+        "api.app:app" if workers > 1 else app,
         host=host,
         port=port,
-        log_level="info"
+        workers=workers,
+        loop=_pick("uvloop", "asyncio"),
+        http=_pick("httptools", "h11"),
+        access_log=False,
+        log_level="warning"
     )
+
+
+def _pick(preferred: str, fallback: str) -> str:
+    """Return preferred if its module is importable, else fallback"""
+    try:
+        __import__(preferred)
+    except ImportError:
+        return fallback
+    return preferred
@@ -24,7 +24,7 @@ from dataclasses import dataclass
 import time
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerState:
     """Current state snapshot"""
     worker_id: str
@@ -33,7 +33,7 @@ class WorkerState:
     data: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class Pressure:
     """Unfulfilled demand or constraint violation"""
     pressure_id: str
@@ -43,7 +43,7 @@ class Pressure:
     timestamp: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Constraint:
     """Sacred limit that must not be violated"""
     constraint_id: str
@@ -52,7 +52,7 @@ class Constraint:
     rationale: str
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowAction:
     """Possible action in current flow"""
     action_id: str
@@ -62,7 +62,7 @@ class FlowAction:
     prerequisites: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class VoidResult:
     """Simulation result WITHOUT side effects"""
     action_id: str
@@ -73,7 +73,7 @@ class VoidResult:
     warnings: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Actual execution result WITH side effects"""
     action_id: str
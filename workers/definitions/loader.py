@@ -2,12 +2,20 @@
 Worker Definition Loader (R13.1)
 
 Loads YAML worker definitions into Python dataclass instances.
-Layer 1 of Defense in Depth: yaml.safe_load() blocks code execution.
+Layer 1 of Defense in Depth: the safe YAML loader blocks code execution.
 """
 
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Union
+from typing import Any, Union
+
+# libyaml-backed safe loader when available (same tag restrictions as
+# SafeLoader, parsed in C)
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
 from .schema import (
     WorkerDefinition,
@@ -18,6 +26,18 @@ from .schema import (
 )
 
 
+@lru_cache(maxsize=64)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a YAML file, cached per (path, mtime, size).
+
+    Editing the file changes its mtime/size and therefore the cache key,
+    so a stale parse is never returned.
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
 def load_worker_definition(path: Union[str, Path]) -> WorkerDefinition:
     """
     Load worker definition from YAML file.
@@ -35,16 +55,19 @@ def load_worker_definition(path: Union[str, Path]) -> WorkerDefinition:
         TypeError: If field types are incorrect
 
     Security:
-        Uses yaml.safe_load() to prevent code execution in YAML.
+        Uses the safe YAML loader (CSafeLoader/SafeLoader) to prevent code
+        execution in YAML.
     """
     path = Path(path)
 
     if not path.exists():
         raise FileNotFoundError(f"Worker definition not found: {path}")
 
-    # Layer 1: safe_load blocks !!python/object and code execution
-    with open(path, 'r') as f:
-        data = yaml.safe_load(f)
+    # Layer 1: safe loader blocks !!python/object and code execution.
+    # The parsed document is cached, so the lists below are copied to keep
+    # definitions independent of each other.
+    stat = path.stat()
+    data = _parse_yaml(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
 
     if not isinstance(data, dict):
         raise ValueError(f"Invalid YAML: expected dict, got {type(data).__name__}")
@@ -59,7 +82,7 @@ def load_worker_definition(path: Union[str, Path]) -> WorkerDefinition:
     identity = WorkerIdentity(
         name=identity_data.get('name', ''),
         system_prompt=identity_data.get('system_prompt', ''),
-        onboarding_steps=identity_data.get('onboarding_steps', [])
+        onboarding_steps=list(identity_data.get('onboarding_steps', []))
     )
 
     # Load constraints section
@@ -79,7 +102,7 @@ def load_worker_definition(path: Union[str, Path]) -> WorkerDefinition:
     runtime = WorkerRuntime(
         container=runtime_data.get('container', 'claude-code:mcp-session'),
         workspace_template=runtime_data.get('workspace_template', ''),
-        tools=runtime_data.get('tools', []),
+        tools=list(runtime_data.get('tools', [])),
         session_persistence=runtime_data.get('session_persistence', True)
     )
 
@@ -100,7 +123,7 @@ def load_worker_definition(path: Union[str, Path]) -> WorkerDefinition:
         runtime=runtime,
         trust_level=data.get('trust_level', 'sandboxed'),
         audit=audit,
-        tools=data.get('tools', [])
+        tools=list(data.get('tools', []))
     )
 
     return worker
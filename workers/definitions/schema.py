@@ -9,7 +9,7 @@ from dataclasses import dataclass, field
 from typing import Literal
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerIdentity:
     """Worker identity and purpose definition"""
     name: str
@@ -17,7 +17,7 @@ class WorkerIdentity:
     onboarding_steps: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerConstraint:
     """Sacred constraint definition with witness"""
     constraint_id: str
@@ -26,7 +26,7 @@ class WorkerConstraint:
     value: str  # Target value or threshold
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerRuntime:
     """Worker runtime configuration"""
     container: str  # e.g., "claude-code:mcp-session"
@@ -35,7 +35,7 @@ class WorkerRuntime:
     session_persistence: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerAudit:
     """Audit and observability configuration"""
     log_all_actions: bool = True
@@ -43,7 +43,7 @@ class WorkerAudit:
     retention_days: int = 90
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerDefinition:
     """Complete worker definition (loaded from YAML)"""
     worker_id: str  # Unique identifier (e.g., "researcher_v1")
@@ -145,6 +145,23 @@ identity:
         finally:
             Path(temp_path).unlink()
 
+    def test_reload_after_edit(self):
+        """Cached parse is invalidated when the file changes"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            f.write("worker_id: first_v1\ntools: [read]\n")
+            temp_path = f.name
+
+        try:
+            first = load_worker_definition(temp_path)
+            again = load_worker_definition(temp_path)
+            assert again.worker_id == "first_v1"
+            assert again.tools is not first.tools  # instances don't share lists
+
+            Path(temp_path).write_text("worker_id: second_version_v1\ntools: [read]\n")
+            assert load_worker_definition(temp_path).worker_id == "second_version_v1"
+        finally:
+            Path(temp_path).unlink()
+
 
 class TestValidator:
     """Test security validation (Defense Layer 3 & 4)"""
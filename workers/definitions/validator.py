@@ -42,6 +42,18 @@ FORBIDDEN_PATTERNS = [
     r'^\s*from\s+.+\s+import',
 ]
 
+# Compiled once: one combined scan rejects clean fields in a single pass;
+# the individual patterns are only consulted to name the one that matched
+_PATTERN_FLAGS = re.MULTILINE | re.IGNORECASE
+_FORBIDDEN_COMPILED = [
+    (pattern, re.compile(pattern, _PATTERN_FLAGS)) for pattern in FORBIDDEN_PATTERNS
+]
+_FORBIDDEN_ANY = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in FORBIDDEN_PATTERNS),
+    _PATTERN_FLAGS
+)
+_WORKER_ID_RE = re.compile(r'^[a-zA-Z0-9_]+$')
+
 
 # Witness function registry (declarative witness implementations)
 WITNESS_REGISTRY = {
@@ -72,7 +84,7 @@ def validate_worker_definition(worker: WorkerDefinition) -> tuple[bool, Optional
     if not worker.worker_id:
         return False, "worker_id cannot be empty"
 
-    if not re.match(r'^[a-zA-Z0-9_]+$', worker.worker_id):
+    if not _WORKER_ID_RE.match(worker.worker_id):
         return False, f"Invalid worker_id '{worker.worker_id}': Only alphanumeric and underscore allowed"
 
     # Layer 3: Scan all text fields for forbidden patterns
@@ -95,11 +107,11 @@ def validate_worker_definition(worker: WorkerDefinition) -> tuple[bool, Optional
 
     # Scan for forbidden patterns
     for field_name, text in text_fields:
-        if not isinstance(text, str):
+        if not isinstance(text, str) or not _FORBIDDEN_ANY.search(text):
             continue
 
-        for pattern in FORBIDDEN_PATTERNS:
-            if re.search(pattern, text, re.MULTILINE | re.IGNORECASE):
+        for pattern, compiled in _FORBIDDEN_COMPILED:
+            if compiled.search(text):
                 return False, (
                     f"Forbidden code pattern detected in {field_name}: '{pattern}'. "
                     f"Worker definitions must be declarative (no executable code)."
@@ -5,6 +5,7 @@ Spawns worker instances from definitions with isolated workspaces.
 Enforces JOURNEY_ISOLATION constraint: one worker per user journey.
 """
 
+import asyncio
 from typing import Dict, Literal, Union
 from pathlib import Path
 
@@ -162,8 +163,15 @@ class WorkerFactory:
         """
         Terminate all worker instances.
 
-        Useful for testing cleanup and graceful shutdown.
+        Useful for testing cleanup and graceful shutdown. Workers are
+        cleaned up concurrently (container teardown is I/O bound); every
+        worker is attempted before the first failure, if any, is raised.
         """
         journey_ids = list(WorkerFactory._instances.keys())
-        for journey_id in journey_ids:
-            await WorkerFactory.kill(journey_id)
+        results = await asyncio.gather(
+            *(WorkerFactory.kill(journey_id) for journey_id in journey_ids),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
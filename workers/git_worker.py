@@ -10,6 +10,7 @@ KEY PATTERN:
   execute() = Actually run git commands WITH repository modification
 """
 
+import asyncio
 import subprocess
 import time
 from pathlib import Path
@@ -40,9 +41,13 @@ class GitWorker(BaseWorker):
         self,
         worker_id: str = "git_worker_1",
         repo_path: Optional[Path] = None,
+        command_timeout: float = 120.0,
     ):
         super().__init__(worker_id=worker_id, worker_type="git")
         self.repo_path = repo_path or Path.cwd()
+        # Upper bound (seconds) for commit/push, e.g. a push stuck on a
+        # credential prompt or an unreachable remote
+        self.command_timeout = command_timeout
 
         # Sacred constraints
         self._constraints = [
@@ -325,12 +330,7 @@ class GitWorker(BaseWorker):
 
             # SIDE EFFECT: Actually commit
             try:
-                result = subprocess.run(
-                    ["git", "-C", str(self.repo_path), "commit", "-m", message],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
+                result = await self._run_git("commit", "-m", message)
 
                 # Parse commit SHA from output
                 commit_sha = "unknown"
@@ -356,11 +356,11 @@ class GitWorker(BaseWorker):
                     audit_log_id=f"audit_{self.worker_id}_{int(time.time())}",
                 )
 
-            except subprocess.CalledProcessError as e:
+            except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
                 return ExecutionResult(
                     action_id=action.get("action_id", f"exec_commit_{int(time.time())}"),
                     success=False,
-                    actual_outcome={"error": e.stderr},
+                    actual_outcome={"error": e.stderr or str(e)},
                     side_effect_occurred=False,
                     execution_timestamp=self._current_timestamp(),
                     duration_ms=(time.time() - start_time) * 1000,
@@ -382,12 +382,7 @@ class GitWorker(BaseWorker):
 
             # SIDE EFFECT: Actually push
             try:
-                result = subprocess.run(
-                    ["git", "-C", str(self.repo_path), "push"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
+                await self._run_git("push")
 
                 return ExecutionResult(
                     action_id=action.get("action_id", f"exec_push_{int(time.time())}"),
@@ -403,11 +398,11 @@ class GitWorker(BaseWorker):
                     audit_log_id=f"audit_{self.worker_id}_{int(time.time())}",
                 )
 
-            except subprocess.CalledProcessError as e:
+            except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
                 return ExecutionResult(
                     action_id=action.get("action_id", f"exec_push_{int(time.time())}"),
                     success=False,
-                    actual_outcome={"error": e.stderr},
+                    actual_outcome={"error": e.stderr or str(e)},
                     side_effect_occurred=False,
                     execution_timestamp=self._current_timestamp(),
                     duration_ms=(time.time() - start_time) * 1000,
@@ -444,6 +439,46 @@ class GitWorker(BaseWorker):
     # Internal helpers (NOT visible to Manager)
     # ========================================
 
+    async def _run_git(self, *args: str) -> subprocess.CompletedProcess:
+        """
+        Run a git command without blocking the event loop
+
+        Used for the side-effecting commands in execute() (commit, push),
+        which can take seconds on large repos or slow remotes.
+
+        Args:
+            *args: git arguments (run with -C repo_path)
+
+        Returns:
+            CompletedProcess with decoded stdout/stderr
+
+        Raises:
+            subprocess.CalledProcessError: If git exits non-zero
+            subprocess.TimeoutExpired: If git runs past command_timeout
+                (the process is killed and reaped first)
+        """
+        cmd = ["git", "-C", str(self.repo_path), *args]
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(), timeout=self.command_timeout
+            )
+        except asyncio.TimeoutError:
+            # Don't leave a stray git process (or zombie) behind
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(cmd, self.command_timeout)
+
+        result = subprocess.CompletedProcess(
+            cmd, proc.returncode, stdout.decode(), stderr.decode()
+        )
+        result.check_returncode()
+        return result
+
     def _get_current_branch(self) -> str:
         """Read current git branch"""
         try:
@@ -18,11 +18,77 @@ Commands:
 """
 
 import asyncio
-import json
+import os
+import sys
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
 
+# Bytes read from stdin but not yet returned by ainput(). One read can
+# deliver several lines (paste, piped input); the rest wait here, since the
+# fd won't become readable again for data that has already been read.
+_stdin_pending = bytearray()
+
+
+async def ainput(prompt: str = "") -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+
+    Waits for stdin to become readable via the loop's selector, so the MCP
+    client's background tasks keep running while the user types. Reads go
+    straight to the fd (not through sys.stdin's buffer) so lines that arrive
+    together are all seen. Falls back to a worker thread where stdin can't
+    be watched (e.g. Windows, or stdin redirected from a regular file).
+
+    Raises:
+        EOFError: If stdin is closed
+    """
+    print(prompt, end="", flush=True)
+
+    loop = asyncio.get_running_loop()
+    fd = sys.stdin.fileno()
+
+    while True:
+        newline = _stdin_pending.find(b"\n")
+        if newline >= 0:
+            data = bytes(_stdin_pending[:newline + 1])
+            del _stdin_pending[:newline + 1]
+            break
+
+        chunk_ready = loop.create_future()
+
+        def on_readable():
+            if not chunk_ready.done():
+                try:
+                    chunk_ready.set_result(os.read(fd, 4096))
+                except OSError as e:
+                    chunk_ready.set_exception(e)
+
+        try:
+            loop.add_reader(fd, on_readable)
+        except (NotImplementedError, OSError):
+            line = await asyncio.to_thread(sys.stdin.readline)
+            if not line:
+                raise EOFError
+            return line.rstrip("\n")
+
+        try:
+            chunk = await chunk_ready
+        finally:
+            loop.remove_reader(fd)
+
+        if not chunk:
+            # EOF: hand back a final unterminated line, if any
+            data = bytes(_stdin_pending)
+            _stdin_pending.clear()
+            break
+        _stdin_pending.extend(chunk)
+
+    if not data:
+        raise EOFError
+    return data.decode(sys.stdin.encoding or "utf-8", errors="replace").rstrip("\r\n")
+
+
 class MCPClientCLI:
     """Interactive MCP client for Worker Marketplace"""
 
@@ -105,7 +171,7 @@ class MCPClientCLI:
         print("  3. Custom action")
         print()
 
-        choice = input("Enter choice (1-3): ").strip()
+        choice = (await ainput("Enter choice (1-3): ")).strip()
 
         if choice == "1":
             action = {
@@ -119,8 +185,8 @@ class MCPClientCLI:
                 "content": "x" * 2_000_000  # 2MB
             }
         elif choice == "3":
-            action_type = input("Action type: ").strip()
-            target = input("Target: ").strip()
+            action_type = (await ainput("Action type: ")).strip()
+            target = (await ainput("Target: ")).strip()
             action = {"type": action_type, "target": target}
         else:
             print("❌ Invalid choice")
@@ -211,7 +277,7 @@ class MCPClientCLI:
         while True:
             try:
                 # Get command
-                command = input("mcp> ").strip()
+                command = (await ainput("mcp> ")).strip()
 
                 if not command:
                     continue
@@ -269,6 +335,10 @@ class MCPClientCLI:
                 print()
                 print("👋 Use 'exit' to quit")
                 print()
+            except EOFError:
+                # stdin closed (Ctrl-D or end of piped input)
+                print()
+                break
             except Exception as e:
                 print(f"❌ Error: {e}")
                 print()
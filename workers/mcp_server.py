@@ -16,6 +16,7 @@ Usage:
 
 import asyncio
 import logging
+import reprlib
 from typing import Dict, Any
 
 # MCP imports
@@ -30,6 +31,107 @@ from workers.definitions.loader import load_worker_definition
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Bounded repr for logging tool arguments: write actions can carry
+# megabytes of content, which should not be formatted just to be logged
+_args_repr = reprlib.Repr()
+_args_repr.maxstring = 200
+_args_repr.maxother = 200
+
+
+# Tool schemas never change at runtime, so build them once instead of on
+# every tools/list request
+TOOLS: list[Tool] = [
+    Tool(
+        name="spawn_worker",
+        description=(
+            "Spawn isolated worker instance for user journey. "
+            "Workers execute in Docker containers with constrained filesystem. "
+            "Supports workspace pre-seeding and onboarding automation. "
+            "Idempotent - returns existing worker if already spawned for journey."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "worker_id": {
+                    "type": "string",
+                    "description": "Worker definition ID (e.g., 'research_assistant_v1')"
+                },
+                "journey_id": {
+                    "type": "string",
+                    "description": "User journey ID (thread_id from checkpointer)"
+                },
+                "isolation_level": {
+                    "type": "string",
+                    "enum": ["container", "process"],
+                    "default": "process",
+                    "description": "Isolation boundary (container=Docker, process=lightweight)"
+                }
+            },
+            "required": ["worker_id", "journey_id"]
+        }
+    ),
+
+    Tool(
+        name="execute_in_worker",
+        description=(
+            "Execute action in worker workspace with automatic constraint verification. "
+            "Calls void() first to verify constraints, then execute() if safe. "
+            "Returns warnings if constraints violated, output if successful."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "journey_id": {
+                    "type": "string",
+                    "description": "Journey ID of target worker"
+                },
+                "action": {
+                    "type": "object",
+                    "description": "Action specification",
+                    "properties": {
+                        "type": {"type": "string", "description": "Action type (read, write, search, etc.)"},
+                        "command": {"type": "string", "description": "Command to execute"},
+                        "target": {"type": "string", "description": "Target file/resource"},
+                        "content": {"type": "string", "description": "Content for write actions"}
+                    },
+                    "required": ["type"]
+                }
+            },
+            "required": ["journey_id", "action"]
+        }
+    ),
+
+    Tool(
+        name="get_worker_state",
+        description="Get current worker state, metrics, and configuration",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "journey_id": {
+                    "type": "string",
+                    "description": "Journey ID of target worker"
+                }
+            },
+            "required": ["journey_id"]
+        }
+    ),
+
+    Tool(
+        name="kill_worker",
+        description="Terminate worker and cleanup resources (container, workspace)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "journey_id": {
+                    "type": "string",
+                    "description": "Journey ID of worker to terminate"
+                }
+            },
+            "required": ["journey_id"]
+        }
+    )
+]
+
 
 class WorkerMarketplaceMCP:
     """
@@ -53,103 +155,13 @@ class WorkerMarketplaceMCP:
             return await self.handle_call_tool(name, arguments)
 
     async def handle_list_tools(self) -> list[Tool]:
-        """Register available MCP tools"""
-        return [
-            Tool(
-                name="spawn_worker",
-                description=(
-                    "Spawn isolated worker instance for user journey. "
-                    "Workers execute in Docker containers with constrained filesystem. "
-                    "Supports workspace pre-seeding and onboarding automation. "
-                    "Idempotent - returns existing worker if already spawned for journey."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "worker_id": {
-                            "type": "string",
-                            "description": "Worker definition ID (e.g., 'research_assistant_v1')"
-                        },
-                        "journey_id": {
-                            "type": "string",
-                            "description": "User journey ID (thread_id from checkpointer)"
-                        },
-                        "isolation_level": {
-                            "type": "string",
-                            "enum": ["container", "process"],
-                            "default": "process",
-                            "description": "Isolation boundary (container=Docker, process=lightweight)"
-                        }
-                    },
-                    "required": ["worker_id", "journey_id"]
-                }
-            ),
-
-            Tool(
-                name="execute_in_worker",
-                description=(
-                    "Execute action in worker workspace with automatic constraint verification. "
-                    "Calls void() first to verify constraints, then execute() if safe. "
-                    "Returns warnings if constraints violated, output if successful."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "journey_id": {
-                            "type": "string",
-                            "description": "Journey ID of target worker"
-                        },
-                        "action": {
-                            "type": "object",
-                            "description": "Action specification",
-                            "properties": {
-                                "type": {"type": "string", "description": "Action type (read, write, search, etc.)"},
-                                "command": {"type": "string", "description": "Command to execute"},
-                                "target": {"type": "string", "description": "Target file/resource"},
-                                "content": {"type": "string", "description": "Content for write actions"}
-                            },
-                            "required": ["type"]
-                        }
-                    },
-                    "required": ["journey_id", "action"]
-                }
-            ),
-
-            Tool(
-                name="get_worker_state",
-                description="Get current worker state, metrics, and configuration",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "journey_id": {
-                            "type": "string",
-                            "description": "Journey ID of target worker"
-                        }
-                    },
-                    "required": ["journey_id"]
-                }
-            ),
-
-            Tool(
-                name="kill_worker",
-                description="Terminate worker and cleanup resources (container, workspace)",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "journey_id": {
-                            "type": "string",
-                            "description": "Journey ID of worker to terminate"
-                        }
-                    },
-                    "required": ["journey_id"]
-                }
-            )
-        ]
+        """Register available MCP tools (schemas are static, built at import)"""
+        return TOOLS
 
     async def handle_call_tool(self, name: str, arguments: dict) -> list[TextContent]:
         """Execute tool call"""
 
-        logger.info(f"Tool call: {name} with args: {arguments}")
+        logger.info("Tool call: %s with args: %s", name, _args_repr.repr(arguments))
 
         try:
             if name == "spawn_worker":